@@ -0,0 +1,49 @@
+"""
+Buffered output for the examples.
+
+Collects lines and writes them to stdout in one call, instead of one
+write per ``print()``.
+"""
+
+import sys
+from typing import List, Optional, TextIO
+
+
+class Printer:
+    """
+    Line buffer flushed to a stream with a single write.
+
+    Usage:
+        with Printer() as p:
+            for item in items:
+                p(f"  {item}")
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize the printer.
+
+        Args:
+            stream: Destination stream (defaults to sys.stdout at flush time)
+        """
+        self.stream = stream
+        self.buffer: List[str] = []
+
+    def __call__(self, line: str = "") -> None:
+        """Queue a line for output."""
+        self.buffer.append(line)
+        self.buffer.append("\n")
+
+    def flush(self) -> None:
+        """Write all queued lines and clear the buffer."""
+        if self.buffer:
+            stream = self.stream or sys.stdout
+            stream.write("".join(self.buffer))
+            stream.flush()
+            self.buffer.clear()
+
+    def __enter__(self) -> "Printer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
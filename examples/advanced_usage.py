@@ -3,15 +3,24 @@ Advanced example showing error handling, custom configuration, and batch operati
 
 Before running:
 export STARLINK_API_SECRET="your-api-secret"
-export STARLINK_BASE_URL="https://your-api-endpoint.com"  # optional
+export STARLINK_ENVIRONMENT="production"  # or staging, development, demo, local
+
+The process pool example uses NumPy: pip install starlink-sdk[numpy]
 """
 
-import asyncio
-import httpx
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
 from typing import List
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from starlink_sdk import (
+    AIMDLimiter,
+    BatchExecutor,
+    RateAwareGather,
     StarlinkClient,
     StarlinkAPIError,
     StarlinkClientError,
@@ -20,193 +29,297 @@ from starlink_sdk import (
     ValidationError,
     NotFoundError,
     TerminalSummary,
+    create_client,
+    now_utc,
     create_pagination_helper
 )
 
 
-async def error_handling_example(client: StarlinkClient):
+# Client-side request quota shared by everything in this example
+RATE_LIMIT_RPM = 600
+
+
+def error_handling_example(client: StarlinkClient):
     """Example of comprehensive error handling."""
     print("⚠️ Error Handling Examples...")
-    
+
     # Test different error scenarios
     error_scenarios = [
-        ("Invalid terminal ID", lambda: client.get_terminal_detail("INVALID_TERMINAL")),
-        ("Invalid date range", lambda: client.get_fleet_health(
-            from_time=datetime.now(),
-            to_time=datetime.now() - timedelta(hours=1)  # Invalid: end before start
+        ("Invalid terminal ID", lambda: client.terminals.get("INVALID_TERMINAL")),
+        ("Invalid date range", lambda: client.fleet.get_health(
+            from_time=now_utc(),
+            to_time=now_utc() - timedelta(hours=1)  # Invalid: end before start
         )),
-        ("Non-existent metrics", lambda: client.get_terminal_metrics(
+        ("Non-existent metrics", lambda: client.terminals.get_metrics(
             terminal_id="INVALID_TERMINAL",
-            from_time=datetime.now() - timedelta(hours=1),
-            to_time=datetime.now(),
+            from_time=now_utc() - timedelta(hours=1),
+            to_time=now_utc(),
             metrics=["invalid_metric"]
         ))
     ]
-    
-    for description, operation in error_scenarios:
-        print(f"\n🧪 Testing: {description}")
-        try:
-            await operation()
-            print("  ✅ Operation succeeded (unexpected)")
-        except NotFoundError as e:
-            print(f"  🔍 Not found error: {e.message}")
-        except ValidationError as e:
-            print(f"  📝 Validation error: {e.message}")
-            if e.detail:
-                print(f"     Details: {e.detail}")
-        except AuthenticationError as e:
-            print(f"  🔐 Auth error: {e.message}")
-        except RateLimitError as e:
-            print(f"  🚦 Rate limit error: {e.message}")
-            if e.retry_after:
-                print(f"     Retry after: {e.retry_after} seconds")
-        except StarlinkAPIError as e:
-            print(f"  🌐 API error {e.status_code}: {e.message}")
-        except StarlinkClientError as e:
-            print(f"  💻 Client error: {e.message}")
-        except Exception as e:
-            print(f"  ❌ Unexpected error: {e}")
-
-
-async def custom_client_example():
-    """Example of using custom HTTP client configuration."""
+
+    # Run the scenarios concurrently; a 429 with Retry-After holds back
+    # the scenarios that have not started yet instead of throttling them too
+    with RateAwareGather(max_workers=3) as gather:
+        for description, future in gather.as_completed(dict(error_scenarios)):
+            print(f"\n🧪 Testing: {description}")
+            try:
+                future.result()
+                print("  ✅ Operation succeeded (unexpected)")
+            except NotFoundError as e:
+                print(f"  🔍 Not found error: {e.message}")
+            except ValidationError as e:
+                print(f"  📝 Validation error: {e.message}")
+                if e.detail:
+                    print(f"     Details: {e.detail}")
+            except AuthenticationError as e:
+                print(f"  🔐 Auth error: {e}")
+            except RateLimitError as e:
+                print(f"  🚦 Rate limit error: {e.message}")
+                if e.retry_after:
+                    print(f"     Retry after: {e.retry_after} seconds")
+            except StarlinkAPIError as e:
+                print(f"  🌐 API error {e.status_code}: {e.message}")
+            except StarlinkClientError as e:
+                print(f"  💻 Client error: {e.message}")
+            except Exception as e:
+                print(f"  ❌ Unexpected error: {e}")
+
+
+def custom_client_example():
+    """Example of using custom HTTP session configuration."""
     print("\n🔧 Custom Client Configuration...")
-    
-    # Create custom HTTP client with specific settings
-    custom_httpx_client = httpx.AsyncClient(
-        timeout=httpx.Timeout(30.0, read=60.0),  # 30s connect, 60s read
-        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
-        headers={"User-Agent": "StarLink-SDK-Example/1.0"}
+
+    # Bring your own session, e.g. to add headers or proxies. An injected
+    # session keeps its own adapters, so retries are configured on it here
+    # (the client's max_retries only applies to sessions it creates)
+    session = requests.Session()
+    session.headers["User-Agent"] = "StarLink-SDK-Example/1.0"
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
     )
-    
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    session.mount("http://", HTTPAdapter(max_retries=retry))
+
     try:
-        async with StarlinkClient(
-            client=custom_httpx_client,
-            max_retries=5
+        # Longer timeout, and pace requests to the example's quota
+        with StarlinkClient(
+            session=session,
+            timeout=60.0,
+            rate_limit_rpm=RATE_LIMIT_RPM,
         ) as client:
             print("  ✅ Custom client created successfully")
-            
+
             # Test the custom client
-            health = await client.health_check()
+            health = client.health_check()
             print(f"  🏥 Health check with custom client: {health}")
-            
+
     except Exception as e:
         print(f"  ❌ Custom client error: {e}")
     finally:
-        await custom_httpx_client.aclose()
+        # The client only closes sessions it created itself
+        session.close()
 
 
-async def batch_operations_example(client: StarlinkClient):
+def batch_operations_example(client: StarlinkClient):
     """Example of batch operations and parallel processing."""
     print("\n🔄 Batch Operations Example...")
-    
+
     # Get list of terminals first
-    terminals_response = await client.list_terminals(limit=5)
+    terminals_response = client.terminals.list(limit=5)
     terminal_ids = [t.terminal_id for t in terminals_response.items]
-    
+
     if not terminal_ids:
         print("  ⚠️ No terminals available for batch operations")
         return
-    
+
     print(f"  📡 Processing {len(terminal_ids)} terminals in parallel...")
-    
-    # Batch get terminal details (parallel)
-    async def get_terminal_detail_safe(terminal_id: str):
-        try:
-            return await client.get_terminal_detail(terminal_id)
-        except Exception as e:
-            print(f"    ❌ Error getting details for {terminal_id}: {e}")
-            return None
-    
-    # Execute in parallel
-    start_time = datetime.now()
-    terminal_details = await asyncio.gather(
-        *[get_terminal_detail_safe(tid) for tid in terminal_ids],
-        return_exceptions=True
-    )
-    duration = datetime.now() - start_time
-    
-    successful_details = [d for d in terminal_details if d is not None]
+
+    def get_metrics(terminal_id: str):
+        return client.terminals.get_metrics(
+            terminal_id=terminal_id,
+            from_time=now_utc() - timedelta(hours=1),
+            to_time=now_utc(),
+            metrics=["latency_ms", "downlink_mbps"]
+        )
+
+    # Concurrency adapts to latency and backs off on 429/502/503;
+    # the client's token bucket paces the actual requests
+    limiter = AIMDLimiter(target_latency=0.5, c_max=16)
+
+    successful_details = []
+    successful_metrics = []
+
+    with BatchExecutor(limiter=limiter) as executor:
+        start_time = now_utc()
+        detail_futures = {
+            executor.submit(client.terminals.get, tid): tid for tid in terminal_ids
+        }
+        metrics_futures = {}
+
+        # Pipeline: request each terminal's metrics as soon as its details
+        # arrive, instead of waiting for every detail call to finish first
+        for future in as_completed(detail_futures):
+            terminal_id = detail_futures[future]
+            try:
+                detail = future.result()
+            except Exception as e:
+                print(f"    ❌ Error getting details for {terminal_id}: {e}")
+                continue
+
+            successful_details.append(detail)
+            metrics_futures[executor.submit(get_metrics, terminal_id)] = terminal_id
+
+        for future in as_completed(metrics_futures):
+            terminal_id = metrics_futures[future]
+            try:
+                successful_metrics.append(future.result())
+            except Exception as e:
+                print(f"    ❌ Error getting metrics for {terminal_id}: {e}")
+
+        duration = now_utc() - start_time
+
     print(f"  ✅ Retrieved details for {len(successful_details)}/{len(terminal_ids)} terminals")
+    print(f"  📈 Retrieved metrics for {len(successful_metrics)} terminals")
     print(f"  ⏱️ Total time: {duration.total_seconds():.2f} seconds")
-    
-    # Batch get metrics for successful terminals
-    if successful_details:
-        print(f"\n📊 Getting metrics for terminals...")
-        
-        async def get_metrics_safe(terminal_id: str):
+    print(f"  🎚️ Concurrency settled at {limiter.current}")
+
+
+def process_terminal(terminal_id: str, rate_limit_rpm: float) -> dict:
+    """
+    Fetch one terminal's details and metrics and reduce them to a summary.
+
+    Runs inside a worker process; create_client returns the same client for
+    every call in that process, so connections and the token are reused.
+    ``rate_limit_rpm`` is this process's share of the overall quota.
+    """
+    client = create_client(timeout=30.0, max_retries=3, rate_limit_rpm=rate_limit_rpm)
+
+    detail = client.terminals.get(terminal_id)
+    metrics = client.terminals.get_metrics(
+        terminal_id=terminal_id,
+        from_time=now_utc() - timedelta(hours=1),
+        to_time=now_utc(),
+        metrics=["latency_ms", "downlink_mbps"]
+    )
+
+    averages = {
+        name: float(series.v.mean())
+        for name, series in metrics.to_arrays().items()
+        if len(series)
+    }
+    return {"terminal_id": terminal_id, "status": detail.status, "averages": averages}
+
+
+def process_pool_example(client: StarlinkClient):
+    """Example of spreading per-terminal work across CPU cores."""
+    print("\n🧮 Process Pool Example...")
+
+    terminal_ids = [t.terminal_id for t in client.terminals.list(limit=20).items]
+    if not terminal_ids:
+        print("  ⚠️ No terminals available for processing")
+        return
+
+    # Each worker process fetches and aggregates its own terminals, so
+    # aggregation of large fleets is not bound to a single core
+    workers = min(len(terminal_ids), os.cpu_count() or 1)
+    print(f"  🏭 Processing {len(terminal_ids)} terminals across {workers} processes...")
+
+    # Rate limiters are per process: split the quota so the workers
+    # together stay within it
+    worker_rpm = RATE_LIMIT_RPM / workers
+
+    summaries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_terminal, tid, worker_rpm): tid for tid in terminal_ids}
+        for future in as_completed(futures):
             try:
-                return await client.get_terminal_metrics(
-                    terminal_id=terminal_id,
-                    from_time=datetime.now() - timedelta(hours=1),
-                    to_time=datetime.now(),
-                    metrics=["latency_ms", "downlink_mbps"]
-                )
+                summaries.append(future.result())
             except Exception as e:
-                print(f"    ❌ Error getting metrics for {terminal_id}: {e}")
-                return None
-        
-        metrics_results = await asyncio.gather(
-            *[get_metrics_safe(d.terminal_id) for d in successful_details],
-            return_exceptions=True
-        )
-        
-        successful_metrics = [m for m in metrics_results if m is not None]
-        print(f"  📈 Retrieved metrics for {len(successful_metrics)} terminals")
+                print(f"    ❌ Error processing {futures[future]}: {e}")
+
+    for summary in summaries:
+        latency = summary["averages"].get("latency_ms")
+        latency_str = f"{latency:.1f}ms" if latency is not None else "n/a"
+        print(f"    {summary['terminal_id']}: {summary['status']} | avg latency {latency_str}")
 
 
-async def pagination_helper_example(client: StarlinkClient):
+def pagination_helper_example(client: StarlinkClient):
     """Example using pagination helper for large datasets."""
     print("\n📚 Pagination Helper Example...")
-    
-    # Create pagination helper for terminals
+
+    # Create pagination helper for terminals; each next page is fetched
+    # in the background while the current one is processed
     paginator = create_pagination_helper(
-        client,
-        'list_terminals',
+        client.terminals,
+        'list',
+        prefetch=True,
         limit=10  # Small page size for demo
     )
-    
+
     all_terminals: List[TerminalSummary] = []
     page_count = 0
-    
+
     print("  📄 Fetching all terminals using pagination helper...")
-    
-    while paginator.has_more and page_count < 5:  # Limit to 5 pages for demo
-        page = await paginator.get_next_page()
-        if page:
-            all_terminals.extend(page.items)
-            page_count += 1
-            print(f"    Page {page_count}: {len(page.items)} terminals")
-        else:
-            break
-    
+
+    try:
+        while paginator.has_more and page_count < 5:  # Limit to 5 pages for demo
+            page = paginator.get_next_page()
+            if page:
+                all_terminals.extend(page.items)
+                page_count += 1
+                print(f"    Page {page_count}: {len(page.items)} terminals")
+            else:
+                break
+    finally:
+        paginator.close()
+
     print(f"  ✅ Total terminals collected: {len(all_terminals)}")
-    
-    # Show summary by status
+
+
+def streaming_example(client: StarlinkClient):
+    """Example of streaming every terminal without holding whole pages in memory."""
+    print("\n🌊 Streaming Example...")
+
+    # Terminals are parsed one at a time as the response arrives, and only
+    # the status field is requested since that is all the summary needs
     status_counts = {}
-    for terminal in all_terminals:
+    for terminal in client.terminals.iter_list(limit=100, fields=['status']):
         status = terminal.status
         status_counts[status] = status_counts.get(status, 0) + 1
-    
+
     print("  📊 Terminal status summary:")
     for status, count in status_counts.items():
         print(f"    {status}: {count}")
 
 
-async def main():
+def main():
     """Main example function."""
     try:
-        async with StarlinkClient(timeout=30.0, max_retries=3) as client:
-            await error_handling_example(client)
-            await batch_operations_example(client)
-            await pagination_helper_example(client)
-        
+        # Shared client: connections and token are reused across examples,
+        # with enough pooled connections for the batch example's fan-out
+        client = create_client(
+            timeout=30.0,
+            max_retries=3,
+            rate_limit_rpm=RATE_LIMIT_RPM,
+            pool_maxsize=16,
+        )
+        error_handling_example(client)
+        batch_operations_example(client)
+        process_pool_example(client)
+        pagination_helper_example(client)
+        streaming_example(client)
+
         # Test custom client configuration separately
-        await custom_client_example()
-        
+        custom_client_example()
+
     except Exception as e:
         print(f"💥 Unexpected error in main: {e}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
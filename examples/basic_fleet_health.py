@@ -7,9 +7,9 @@ export STARLINK_BASE_URL="https://your-api-endpoint.com"  # optional
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from starlink_sdk import StarlinkClient
+from starlink_sdk import StarlinkClient, now_utc
 
 
 async def main():
@@ -22,7 +22,7 @@ async def main():
         
         # Get fleet health for the last 24 hours
         print("\n📊 Getting fleet health overview...")
-        end_time = datetime.now()
+        end_time = now_utc()
         start_time = end_time - timedelta(hours=24)
         
         fleet_health = await client.get_fleet_health(
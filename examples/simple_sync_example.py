@@ -6,8 +6,10 @@ export STARLINK_API_SECRET="your-api-secret"
 export STARLINK_ENVIRONMENT="production"  # or staging, development, demo, local
 """
 
-from datetime import datetime, timedelta
-from starlink_sdk import StarlinkClient
+from datetime import timedelta
+from starlink_sdk import StarlinkClient, now_utc
+
+_STATUS_EMOJI = {"online": "🟢", "degraded": "🟡", "offline": "🔴"}
 
 
 def main():
@@ -24,14 +26,20 @@ def main():
     
     # Check API health
     print("\n🏥 Checking API health...")
-    health_status = client.health_check()
+    # One streamed update instead of polling; falls back to /health
+    health_updates = client.stream_health()
+    health_status = next(health_updates, None)
+    health_updates.close()
+    if health_status is None:
+        # The stream closed before sending an update
+        health_status = client.health_check()
     print(f"API Status: {health_status}")
     
     # Get fleet health - simple method call
     print("\n📊 Getting fleet health...")
     health = client.fleet.get_health(
-        from_time=datetime.now() - timedelta(hours=24),
-        to_time=datetime.now()
+        from_time=now_utc() - timedelta(hours=24),
+        to_time=now_utc()
     )
     
     print(f"Fleet Status:")
@@ -45,7 +53,7 @@ def main():
     
     print(f"Found {len(terminals.items)} terminals:")
     for terminal in terminals.items:
-        status_emoji = {"online": "🟢", "degraded": "🟡", "offline": "🔴"}.get(terminal.status, "⚫")
+        status_emoji = _STATUS_EMOJI.get(terminal.status, "⚫")
         print(f"  {status_emoji} {terminal.terminal_id} - {terminal.status}")
     
     # Get details for first terminal if available
@@ -62,8 +70,8 @@ def main():
         print(f"\n📊 Getting metrics...")
         metrics = client.terminals.get_metrics(
             terminal_id=terminal_id,
-            from_time=datetime.now() - timedelta(hours=1),
-            to_time=datetime.now(),
+            from_time=now_utc() - timedelta(hours=1),
+            to_time=now_utc(),
             metrics=["latency_ms", "downlink_mbps"]
         )
         
@@ -41,12 +41,25 @@ Example:
     ```
 """
 
+from ._version import __version__
+from .async_client import AsyncPaginationHelper, AsyncStarlinkClient
 from .client import StarlinkClient, create_client
+from .concurrency import AIMDLimiter, BatchExecutor, RateAwareGather
+from .exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    PermissionError,
+    RateLimitError,
+    StarlinkAPIError,
+    StarlinkClientError,
+    StarlinkError,
+    ValidationError,
+)
 from .models import (
     Alert,
     AlertSeverity,
-    AlertStatus,
     AlertsListResponse,
+    AlertStatus,
     FleetCounts,
     FleetHealthResponse,
     HealthFactor,
@@ -54,6 +67,7 @@ from .models import (
     Interval,
     Location,
     MetricPoint,
+    MetricSeries,
     MetricsResponse,
     TelemetryIngestRequest,
     TelemetryIngestResponse,
@@ -63,35 +77,36 @@ from .models import (
     TerminalSummary,
     TopIssue,
 )
-from .exceptions import (
-    StarlinkError,
-    StarlinkAPIError,
-    StarlinkClientError,
-    AuthenticationError,
-    RateLimitError,
-    ValidationError,
-    NotFoundError,
-    PermissionError,
-)
+from .ratelimit import TokenBucket
+from .retry import AATBScheduler, ATBScheduler
 from .utils import (
+    create_pagination_helper,
+    format_datetime,
     generate_idempotency_key,
     now_utc,
     parse_datetime,
-    format_datetime,
-    validate_terminal_id,
     validate_metrics_list,
-    create_pagination_helper,
+    validate_terminal_id,
 )
 
-__version__ = "0.1.0"
 __author__ = "SpaceX"
 __email__ = "dev@spacex.com"
 
 __all__ = [
     # Main client
     "StarlinkClient",
+    "AsyncStarlinkClient",
+    "AsyncPaginationHelper",
     "create_client",
     
+    # Concurrency and rate limiting
+    "AIMDLimiter",
+    "BatchExecutor",
+    "RateAwareGather",
+    "TokenBucket",
+    "ATBScheduler",
+    "AATBScheduler",
+    
     # Models
     "Alert",
     "AlertSeverity", 
@@ -104,6 +119,7 @@ __all__ = [
     "Interval",
     "Location",
     "MetricPoint",
+    "MetricSeries",
     "MetricsResponse",
     "TelemetryIngestRequest",
     "TelemetryIngestResponse",
@@ -0,0 +1,3 @@
+"""Version of the Starlink SDK."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,663 @@
+"""Asynchronous client for the Starlink Enterprise Dashboard API."""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from .auth import TokenManager
+from .client import (
+    _ALERT_PATH,
+    _INTERVAL_5M,
+    _INTERVAL_STR,
+    _TERMINAL_METRICS_PATH,
+    _TERMINAL_PATH,
+    BASE_HEADERS,
+    URL_CACHE_SIZE,
+    StarlinkClient,
+    _api_error,
+    _dumps,
+    _encode_query,
+    _fields_param,
+    _gzip_body,
+    _iso,
+    _loads,
+)
+from .exceptions import AuthenticationError, StarlinkClientError
+from .models import (
+    AlertSeverity,
+    AlertsListResponse,
+    AlertStatus,
+    AlertUpdateRequest,
+    AlertUpdateResponse,
+    FleetHealthResponse,
+    Interval,
+    MetricsResponse,
+    TelemetryIngestRequest,
+    TelemetryIngestResponse,
+    TerminalListResponse,
+    TerminalStatus,
+    TerminalSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _require_httpx() -> Any:
+    """Import httpx, raising a helpful error if it is not installed."""
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "httpx is required for AsyncStarlinkClient; "
+            "install it with `pip install starlink-sdk[async]`"
+        ) from e
+    return httpx
+
+
+class AsyncStarlinkClient:
+    """
+    Asynchronous client for the Starlink Enterprise Dashboard API.
+
+    Mirrors ``StarlinkClient`` with ``async`` methods on an ``httpx.AsyncClient``
+    speaking HTTP/2, so many concurrent calls (e.g. ``asyncio.gather`` over
+    ``terminals.get_metrics``) are multiplexed over a single connection.
+
+    Usage:
+        from starlink_sdk import AsyncStarlinkClient
+
+        async with AsyncStarlinkClient() as client:
+            metrics = await asyncio.gather(*[
+                client.terminals.get_metrics(tid, from_time=..., to_time=...)
+                for tid in terminal_ids
+            ])
+    """
+
+    ENVIRONMENT_URLS = StarlinkClient.ENVIRONMENT_URLS
+
+    def __init__(
+        self,
+        environment: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        client: Optional[Any] = None,
+    ):
+        """
+        Initialize the async Starlink client.
+
+        Args:
+            environment: Environment name (production, staging, development, demo, local)
+                        Defaults to STARLINK_ENVIRONMENT env var or 'production'
+            api_secret: API secret (defaults to STARLINK_API_SECRET env var)
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed connections
+            http2: Negotiate HTTP/2 (requires the ``h2`` package)
+            max_connections: Maximum number of open connections
+            max_keepalive_connections: Idle connections kept for reuse
+            client: ``httpx.AsyncClient`` to send requests with (defaults to a
+                   new client owned and closed by this client)
+        """
+        httpx = _require_httpx()
+
+        env = (
+            environment
+            or os.getenv('STARLINK_ENVIRONMENT')
+            or 'production'
+        ).lower()
+
+        if env not in self.ENVIRONMENT_URLS:
+            raise ValueError(
+                f"Invalid environment '{env}'. "
+                f"Must be one of: {', '.join(self.ENVIRONMENT_URLS.keys())}"
+            )
+
+        self.environment = env
+        self.base_url = self.ENVIRONMENT_URLS[env].rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._url_cache: dict[str, str] = {}
+        logger.debug("Using Starlink API base URL: %s", self.base_url)
+
+        self._owns_client = client is None
+        if client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=http2,
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            )
+            client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        self._client = client
+
+        # Token refreshes are synchronous and run off the event loop
+        self.token_manager = TokenManager(
+            base_url=self.base_url,
+            api_secret=api_secret,
+            timeout=timeout
+        )
+
+        # Initialize API namespaces
+        self.fleet = AsyncFleetAPI(self)
+        self.terminals = AsyncTerminalsAPI(self)
+        self.alerts = AsyncAlertsAPI(self)
+        self.telemetry = AsyncTelemetryAPI(self)
+
+    async def _auth_header(self) -> dict:
+        """Get the auth header, refreshing the token in a worker thread if needed."""
+        if self.token_manager.has_valid_token:
+            return self.token_manager.get_auth_header()
+        return await asyncio.to_thread(self.token_manager.get_auth_header)
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """
+        Make an authenticated HTTP request.
+
+        Connection failures are retried by the transport; a rejected token
+        is refreshed once.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json: JSON body
+            data: Pre-encoded JSON body (used when ``json`` is not given)
+            headers: Additional headers
+
+        Returns:
+            HTTP response
+
+        Raises:
+            StarlinkAPIError: For API-specific errors
+            StarlinkClientError: For client-side errors
+        """
+        httpx = _require_httpx()
+
+        logger.debug("Making %s request to endpoint: %s", method, endpoint)
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            if len(self._url_cache) < URL_CACHE_SIZE:
+                self._url_cache[endpoint] = url
+
+        if params:
+            url = f"{url}?{_encode_query(params)}"
+
+        body = data
+        if json is not None:
+            body = _dumps(json)
+
+        auth_header = await self._auth_header()
+        request_headers = {**BASE_HEADERS, **auth_header}
+        if headers:
+            request_headers.update(headers)
+        if body is not None:
+            request_headers['Content-Type'] = 'application/json'
+
+        auth_refreshed = False
+        while True:
+            try:
+                response = await self._client.request(
+                    method, url, content=body, headers=request_headers
+                )
+            except httpx.HTTPError as e:
+                if self._owns_client:
+                    # The transport has already retried connection failures
+                    raise StarlinkClientError(f"Request failed after {self.max_retries} retries: {str(e)}") from e
+                raise StarlinkClientError(f"Request failed: {str(e)}") from e
+
+            if response.is_success:
+                return response
+
+            if response.status_code == 401:
+                if auth_refreshed:
+                    raise AuthenticationError(
+                        "Request rejected with HTTP 401 after refreshing the access token"
+                    )
+                # The cached token was rejected: fetch a new one and retry once.
+                # Invalidating the header that was sent is a no-op once another
+                # caller has replaced it, so concurrent 401s refresh only once
+                await asyncio.to_thread(self.token_manager.invalidate, auth_header)
+                auth_refreshed = True
+                request_headers.update(await self._auth_header())
+                continue
+
+            raise _api_error(response)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this client created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncStarlinkClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def health_check(self) -> dict:
+        """
+        Check API health status.
+
+        Returns:
+            Health check response
+        """
+        response = await self._make_request('GET', '/health')
+        result: dict = _loads(response.content)
+        return result
+
+    async def get_api_info(self) -> dict:
+        """
+        Get basic API information.
+
+        Returns:
+            API information
+        """
+        response = await self._make_request('GET', '/')
+        result: dict = _loads(response.content)
+        return result
+
+
+class AsyncFleetAPI:
+    """Fleet management API methods."""
+
+    __slots__ = ('client', '_req')
+
+    def __init__(self, client: AsyncStarlinkClient):
+        self.client = client
+        self._req = client._make_request
+
+    async def get_health(
+        self,
+        from_time: datetime,
+        to_time: datetime
+    ) -> FleetHealthResponse:
+        """
+        Get fleet health summary.
+
+        Args:
+            from_time: Start time for health summary
+            to_time: End time for health summary
+
+        Returns:
+            Fleet health response
+        """
+        params = {
+            'from': _iso(from_time),
+            'to': _iso(to_time)
+        }
+
+        response = await self._req('GET', '/v1/fleet/health', params=params)
+        return FleetHealthResponse.model_validate_json(response.content)
+
+
+class AsyncTerminalsAPI:
+    """Terminal management API methods."""
+
+    __slots__ = ('client', '_req')
+
+    def __init__(self, client: AsyncStarlinkClient):
+        self.client = client
+        self._req = client._make_request
+
+    async def list(
+        self,
+        status: Optional[Union[TerminalStatus, str]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> TerminalListResponse:
+        """
+        List terminals for an account.
+
+        Args:
+            status: Filter by terminal status
+            limit: Maximum number of results (1-500)
+            cursor: Pagination cursor
+            fields: Only return these terminal fields (``terminal_id`` is
+                    always included; the rest are left as None)
+
+        Returns:
+            Terminal list response
+        """
+        params: Dict[str, Any] = {'limit': min(max(limit, 1), 500)}
+
+        if status:
+            params['status'] = status
+        if fields:
+            params['fields'] = _fields_param(fields)
+        if cursor:
+            params['cursor'] = cursor
+
+        response = await self._req('GET', '/v1/terminals', params=params)
+        return TerminalListResponse.model_validate_json(response.content)
+
+    async def get(self, terminal_id: str) -> TerminalSummary:
+        """
+        Get detailed information about a terminal.
+
+        Args:
+            terminal_id: Terminal identifier
+
+        Returns:
+            Terminal summary response
+        """
+        response = await self._req('GET', _TERMINAL_PATH % terminal_id)
+        return TerminalSummary.model_validate_json(response.content)
+
+    async def get_metrics(
+        self,
+        terminal_id: str,
+        from_time: datetime,
+        to_time: datetime,
+        interval: Union[Interval, str] = _INTERVAL_5M,
+        metrics: Optional[List[str]] = None
+    ) -> MetricsResponse:
+        """
+        Get time-series metrics for a terminal.
+
+        Args:
+            terminal_id: Terminal identifier
+            from_time: Start time (inclusive)
+            to_time: End time (exclusive)
+            interval: Aggregation interval (default 5 minutes)
+            metrics: List of metric keys to retrieve
+
+        Returns:
+            Metrics response
+        """
+        params = {
+            'from': _iso(from_time),
+            'to': _iso(to_time),
+            'interval': _INTERVAL_STR.get(interval, interval)
+        }
+
+        if metrics:
+            params['metrics'] = ','.join(metrics)
+
+        response = await self._req('GET', _TERMINAL_METRICS_PATH % terminal_id, params=params)
+        return MetricsResponse.model_validate_json(response.content)
+
+
+class AsyncAlertsAPI:
+    """Alert management API methods."""
+
+    __slots__ = ('client', '_req')
+
+    def __init__(self, client: AsyncStarlinkClient):
+        self.client = client
+        self._req = client._make_request
+
+    async def list(
+        self,
+        status: Optional[Union[AlertStatus, str]] = None,
+        severity: Optional[Union[AlertSeverity, str]] = None,
+        terminal_id: Optional[str] = None,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> AlertsListResponse:
+        """
+        List alerts with filtering options.
+
+        Args:
+            status: Filter by alert status (optional)
+            severity: Filter by severity
+            terminal_id: Filter by terminal
+            from_time: Filter by creation time (start)
+            to_time: Filter by creation time (end)
+            limit: Maximum number of results (1-500)
+            cursor: Pagination cursor
+
+        Returns:
+            Alerts list response
+        """
+        params: Dict[str, Any] = {'limit': min(max(limit, 1), 500)}
+
+        if status:
+            params['status'] = status
+        if severity:
+            params['severity'] = severity
+        if terminal_id:
+            params['terminal_id'] = terminal_id
+        if from_time:
+            params['from'] = _iso(from_time)
+        if to_time:
+            params['to'] = _iso(to_time)
+        if cursor:
+            params['cursor'] = cursor
+
+        response = await self._req('GET', '/v1/alerts', params=params)
+        return AlertsListResponse.model_validate_json(response.content)
+
+    async def update(
+        self,
+        alert_id: str,
+        status: Union[AlertStatus, str, dict, AlertUpdateRequest],
+        idempotency_key: Optional[str] = None
+    ) -> AlertUpdateResponse:
+        """
+        Update an alert's status.
+
+        Args:
+            alert_id: Alert identifier
+            status: New status for the alert (e.g., "acknowledged", "resolved", "open"),
+                    or a full update as a dict or AlertUpdateRequest
+            idempotency_key: Optional idempotency key for request deduplication
+
+        Returns:
+            Alert update response
+        """
+        if isinstance(status, AlertUpdateRequest):
+            update_request = status
+        else:
+            try:
+                if isinstance(status, dict):
+                    update_request = AlertUpdateRequest.model_validate(status)
+                else:
+                    update_request = AlertUpdateRequest(status=AlertStatus(status))
+            except Exception as e:
+                raise StarlinkClientError(f"Invalid status '{status}': {e}") from e
+
+        headers = {}
+        if idempotency_key:
+            headers['Idempotency-Key'] = idempotency_key
+
+        response = await self._req(
+            'PATCH',
+            _ALERT_PATH % alert_id,
+            data=update_request.model_dump_json(exclude_none=True).encode('utf-8'),
+            headers=headers if headers else None
+        )
+        return AlertUpdateResponse.model_validate_json(response.content)
+
+
+class AsyncTelemetryAPI:
+    """Telemetry ingestion API methods."""
+
+    __slots__ = ('client', '_req')
+
+    def __init__(self, client: AsyncStarlinkClient):
+        self.client = client
+        self._req = client._make_request
+
+    async def ingest(
+        self,
+        request: TelemetryIngestRequest,
+        idempotency_key: str
+    ) -> TelemetryIngestResponse:
+        """
+        Ingest telemetry data for a terminal.
+
+        Args:
+            request: Telemetry ingest request
+            idempotency_key: Unique key for request idempotency
+
+        Returns:
+            Telemetry ingest response
+        """
+        headers = {'Idempotency-Key': idempotency_key}
+
+        body = _gzip_body(request.to_bytes(), headers)
+
+        response = await self._req(
+            'POST',
+            '/v1/telemetry',
+            data=body,
+            headers=headers
+        )
+        return TelemetryIngestResponse.model_validate_json(response.content)
+
+    async def ingest_many(
+        self,
+        batch: Sequence[Tuple[TelemetryIngestRequest, str]]
+    ) -> List[TelemetryIngestResponse]:
+        """
+        Ingest several telemetry requests concurrently.
+
+        All requests are in flight at once, multiplexed over the client's
+        HTTP/2 connection, so a batch costs about one round-trip rather
+        than one per request.
+
+        Args:
+            batch: ``(request, idempotency_key)`` pairs
+
+        Returns:
+            Telemetry ingest responses, in the order of ``batch``
+        """
+        return await asyncio.gather(
+            *(self.ingest(request, idempotency_key) for request, idempotency_key in batch)
+        )
+
+
+class AsyncPaginationHelper:
+    """
+    Pages through an async list method, fetching the next page while the
+    current one is being processed.
+
+    Usage:
+        pages = AsyncPaginationHelper(client.alerts, 'list', limit=100)
+        alerts = await pages.get_all_items()
+    """
+
+    def __init__(self, client: Any, method_name: str, prefetch: bool = True, **base_params: Any):
+        """
+        Initialize the pagination helper.
+
+        Args:
+            client: Async API namespace (e.g. ``client.alerts``)
+            method_name: Name of the async method to call
+            prefetch: Start fetching the next page as soon as the current
+                      one is returned
+            **base_params: Base parameters for the method
+        """
+        self.client = client
+        self.method_name = method_name
+        self.prefetch = prefetch
+        self.base_params = base_params
+        self.next_cursor: Optional[str] = None
+        self.has_more = True
+        self._next_task: Optional[asyncio.Task] = None
+
+    async def _fetch(self, cursor: Optional[str]) -> Any:
+        """Fetch the page starting at ``cursor``."""
+        params = self.base_params.copy()
+        if cursor:
+            params['cursor'] = cursor
+
+        method = getattr(self.client, self.method_name)
+        return await method(**params)
+
+    async def get_next_page(self, pages_left: Optional[int] = None) -> Any:
+        """
+        Get the next page of results.
+
+        Args:
+            pages_left: Pages the caller will still request after this one
+                        (None for no limit); the following page is not
+                        prefetched when this is 0
+
+        Returns:
+            Next page response, or None when there are no more pages
+        """
+        if self._next_task is not None:
+            task, self._next_task = self._next_task, None
+            response = await task
+        elif not self.has_more:
+            return None
+        else:
+            response = await self._fetch(self.next_cursor)
+
+        self.next_cursor = response.next_cursor
+        self.has_more = bool(self.next_cursor)
+
+        if self.prefetch and self.has_more and pages_left != 0:
+            self._next_task = asyncio.ensure_future(self._fetch(self.next_cursor))
+
+        return response
+
+    async def aclose(self) -> None:
+        """Cancel any page still being prefetched and wait for it to stop."""
+        if self._next_task is not None:
+            task, self._next_task = self._next_task, None
+            task.cancel()
+            # Collects the cancellation (or an error raised before it took
+            # effect) so nothing is left in flight or unretrieved
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def iter_all_items(self, max_pages: Optional[int] = None) -> AsyncIterator:
+        """
+        Iterate over all items across all pages.
+
+        The next page is fetched while the current page's items are being
+        consumed, and only the current page is held in memory.
+
+        Args:
+            max_pages: Maximum number of pages to fetch (None for unlimited)
+
+        Yields:
+            Items from each page in order
+        """
+        page_count = 0
+
+        try:
+            while self.has_more:
+                if max_pages and page_count >= max_pages:
+                    break
+
+                pages_left = max_pages - page_count - 1 if max_pages else None
+                response = await self.get_next_page(pages_left)
+                if response is None:
+                    break
+                page_count += 1
+                for item in response.items:
+                    yield item
+        finally:
+            await self.aclose()
+
+    async def get_all_items(self, max_pages: Optional[int] = None) -> list:
+        """
+        Get all items across all pages.
+
+        Args:
+            max_pages: Maximum number of pages to fetch (None for unlimited)
+
+        Returns:
+            List of all items
+        """
+        return [item async for item in self.iter_all_items(max_pages)]
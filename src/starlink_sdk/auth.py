@@ -1,15 +1,17 @@
 """Authentication handler for the Starlink Enterprise Dashboard API."""
 
+import logging
 import os
 import threading
 import time
-from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import requests
 
 from .models import TokenResponse
 
+logger = logging.getLogger(__name__)
+
 
 class AuthenticationError(Exception):
     """Exception raised when authentication fails."""
@@ -17,13 +19,23 @@ class AuthenticationError(Exception):
 
 
 class TokenManager:
-    """Manages authentication tokens with automatic rotation."""
+    """
+    Manages authentication tokens with automatic rotation.
+    
+    Once a token is 80% through its lifetime it is refreshed on a background
+    thread while callers keep using the current one, so requests only wait
+    on the token endpoint when the token has actually expired.
+    """
+    
+    # Fraction of the token lifetime after which a background refresh starts
+    REFRESH_FRACTION = 0.8
     
     def __init__(
         self, 
         base_url: str, 
         api_secret: Optional[str] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the token manager.
@@ -32,6 +44,8 @@ class TokenManager:
             base_url: Base URL for the API
             api_secret: API secret for authentication (if None, reads from STARLINK_API_SECRET)
             timeout: Request timeout in seconds
+            session: HTTP session used for token requests, so refreshes reuse
+                     the API client's pooled connections
         """
         self.base_url = base_url.rstrip('/')
         self.api_secret = api_secret or os.getenv('STARLINK_API_SECRET')
@@ -39,12 +53,19 @@ class TokenManager:
             raise AuthenticationError("API secret not provided. Set STARLINK_API_SECRET environment variable or pass api_secret parameter.")
         
         self.timeout = timeout
+        self.session = session if session is not None else requests.Session()
         self._token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        # time.time() deadlines: expires_in is a wall-clock duration, so time
+        # spent suspended must count against the token's lifetime
+        self._token_expires_at = 0.0
+        self._valid_until = 0.0
+        self._refresh_at = 0.0
+        self._auth_header: dict[str, str] = {}
         self._refresh_lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
     
     def get_token(self) -> str:
-        print(f"Getting token for base URL: {self.base_url}")
         """
         Get a valid access token, refreshing if necessary.
         
@@ -54,9 +75,16 @@ class TokenManager:
         Raises:
             AuthenticationError: If token acquisition fails
         """
-        if self._is_token_valid():
+        logger.debug("Getting token for base URL: %s", self.base_url)
+        if time.time() < self._refresh_at:
             return self._token
         
+        token = self._token
+        if token is not None and self._is_token_valid():
+            # Due for rotation but still usable: refresh without blocking
+            self._start_background_refresh()
+            return token
+        
         with self._refresh_lock:
             # Check again in case another thread already refreshed
             if self._is_token_valid():
@@ -65,19 +93,78 @@ class TokenManager:
             self._refresh_token()
             return self._token
     
+    @property
+    def has_valid_token(self) -> bool:
+        """Whether ``get_token()`` can return without a blocking refresh."""
+        return self._is_token_valid()
+    
     def _is_token_valid(self) -> bool:
-        """Check if current token is valid and not expired."""
-        if not self._token or not self._token_expires_at:
-            return False
+        """Check if current token is valid and not expired (with a 30 second buffer)."""
+        return self._token is not None and time.time() < self._valid_until
+    
+    def refresh(self) -> str:
+        """
+        Fetch a new token now, even if the current one looks valid.
+        
+        Used when the API rejects the current token.
+        
+        Returns:
+            New access token
+            
+        Raises:
+            AuthenticationError: If token acquisition fails
+        """
+        with self._refresh_lock:
+            self._refresh_token()
+        return self.get_token()
+    
+    def invalidate(self, auth_header: Optional[dict] = None) -> None:
+        """
+        Mark the current token as expired, so the next call fetches a new one.
+        
+        Used when the API rejects a token. Passing the rejected header (as
+        returned by ``get_auth_header``) makes this a no-op if another
+        thread has already replaced that token, so concurrent rejections
+        cause a single refresh.
         
-        # Add 30 second buffer before expiration
-        return datetime.now(timezone.utc) < (self._token_expires_at - timedelta(seconds=30))
+        Args:
+            auth_header: Header the rejected request was sent with
+        """
+        with self._refresh_lock:
+            if auth_header is None or auth_header is self._auth_header:
+                self._valid_until = 0.0
+                self._refresh_at = 0.0
+    
+    def _start_background_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if not self._background_lock.acquire(blocking=False):
+            return
+        
+        self._refresh_thread = threading.Thread(
+            target=self._background_refresh,
+            name="starlink-token-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+    
+    def _background_refresh(self) -> None:
+        """Refresh the token ahead of expiry (runs on the refresh thread)."""
+        try:
+            with self._refresh_lock:
+                if time.time() >= self._refresh_at:
+                    self._refresh_token()
+        except AuthenticationError as e:
+            # The current token is still valid; get_token refreshes in the
+            # foreground once it expires
+            logger.warning("Background token refresh failed: %s", e)
+        finally:
+            self._background_lock.release()
     
     def _refresh_token(self) -> None:
-        print(f"Refreshing token for base URL: {self.base_url}")
         """Refresh the authentication token."""
+        logger.debug("Refreshing token for base URL: %s", self.base_url)
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/v1/auth/token",
                 json={"api_secret": self.api_secret},
                 headers={"Content-Type": "application/json"},
@@ -85,12 +172,19 @@ class TokenManager:
             )
             response.raise_for_status()
             
-            token_data = TokenResponse(**response.json())
+            token_data = TokenResponse.model_validate_json(response.content)
             self._token = token_data.access_token
+            self._auth_header = {"Authorization": f"Bearer {self._token}"}
             
-            # Calculate expiration time
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=token_data.expires_in)
-            self._token_expires_at = expires_at
+            # Calculate expiration time, and when to start rotating the token
+            # (no later than the point where it stops being considered valid)
+            now = time.time()
+            self._token_expires_at = now + token_data.expires_in
+            self._valid_until = self._token_expires_at - 30.0
+            self._refresh_at = min(
+                now + token_data.expires_in * self.REFRESH_FRACTION,
+                self._valid_until
+            )
             
         except requests.HTTPError as e:
             if e.response.status_code == 401:
@@ -103,6 +197,11 @@ class TokenManager:
             raise AuthenticationError(f"Token refresh failed: {str(e)}") from e
     
     def get_auth_header(self) -> dict[str, str]:
-        """Get authorization header with valid token."""
-        token = self.get_token()
-        return {"Authorization": f"Bearer {token}"}
+        """
+        Get authorization header with valid token.
+        
+        The same dict is returned until the token is refreshed; callers
+        must copy it before adding headers.
+        """
+        self.get_token()
+        return self._auth_header
@@ -0,0 +1,137 @@
+"""In-process response caching for the Starlink Enterprise Dashboard API."""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Usage:
+        cache = TTLCache(maxsize=256, ttl=30)
+        cache.set(("GET", "/health", frozenset()), {"status": "ok"})
+        cache.get(("GET", "/health", frozenset()))
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default time-to-live for entries, in seconds
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or ``default``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live for this entry (defaults to the cache's ttl)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], T],
+        ttl: Optional[float] = None
+    ) -> T:
+        """
+        Get a cached value, calling ``fetch`` and caching its result on a miss.
+
+        Args:
+            key: Cache key
+            fetch: Callable producing the value
+            ttl: Time-to-live for a newly cached value
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        value: Optional[T] = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def ttl_cached(ttl: Optional[float] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Cache a client method's results in the instance's ``_cache``.
+
+    The wrapped method is called through unchanged when the instance has
+    caching disabled (``_cache`` is None).
+
+    Args:
+        ttl: Time-to-live for cached results (defaults to the cache's ttl;
+             never longer than it, so a shorter configured ttl wins)
+
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            cache: Optional[TTLCache] = getattr(self, "_cache", None)
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            key = (func.__qualname__, args, frozenset(kwargs.items()))
+            entry_ttl = cache.ttl if ttl is None else min(ttl, cache.ttl)
+            return cache.get_or_fetch(key, lambda: func(self, *args, **kwargs), ttl=entry_ttl)
+
+        return wrapper
+
+    return decorator
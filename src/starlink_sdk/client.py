@@ -1,31 +1,189 @@
 """Main client for the Starlink Enterprise Dashboard API."""
 
+import atexit
+import functools
+import gzip
 import json
+import logging
+import math
 import os
-from datetime import datetime
-from typing import List, Optional, Union
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Union
 from urllib.parse import urlencode
 
 import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # used for decoding when orjson is unavailable
+    ujson = None  # type: ignore[assignment]
+
+from ._version import __version__
 from .auth import TokenManager
-from .exceptions import StarlinkAPIError, StarlinkClientError
+from .cache import TTLCache, ttl_cached
+from .exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    StarlinkAPIError,
+    StarlinkClientError,
+)
 from .models import (
     Alert,
     AlertSeverity,
-    AlertStatus,
     AlertsListResponse,
+    AlertStatus,
     AlertUpdateRequest,
     AlertUpdateResponse,
     FleetHealthResponse,
     Interval,
+    MetricPoint,
+    MetricSeries,
     MetricsResponse,
     TelemetryIngestRequest,
     TelemetryIngestResponse,
-    TerminalSummary,
     TerminalListResponse,
     TerminalStatus,
+    TerminalSummary,
 )
+from .ratelimit import TokenBucket
+from .retry import ATBScheduler, parse_retry_after
+from .streaming import StreamedPage, iter_series
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson or ujson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a JSON request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Transient statuses retried by the transport (429 only without a retry scheduler)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({'GET', 'POST', 'PATCH', 'PUT', 'DELETE'})
+
+
+class _ScheduledRetry(Retry):
+    """
+    Adapter retries for clients whose retry scheduler handles HTTP 429.
+    
+    urllib3 retries 429 whenever ``Retry-After`` is sent, even outside
+    ``status_forcelist``, so it is dropped from the Retry-After statuses too.
+    """
+    
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {429}
+
+
+# Headers sent with every request; Accept-Encoding lists every codec urllib3
+# can decode here (br/zstd only when brotli/zstandard are installed)
+BASE_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+    'User-Agent': f'starlink-sdk/{__version__}',
+}
+
+# Path templates for per-resource endpoints
+_TERMINAL_PATH = '/v1/terminals/%s'
+_TERMINAL_METRICS_PATH = '/v1/terminals/%s/metrics'
+_ALERT_PATH = '/v1/alerts/%s'
+
+# Resolved URLs (with and without query strings) kept per client; capped so
+# per-resource paths and parameter sets can't grow the caches unbounded
+URL_CACHE_SIZE = 1024
+
+# List calls at or below this page size are served from the response cache
+CACHEABLE_LIST_LIMIT = 10
+
+# Request bodies above this size are gzipped before sending
+GZIP_MIN_BYTES = 1024
+
+
+def _gzip_body(body: bytes, headers: dict) -> bytes:
+    """Gzip a request body larger than ``GZIP_MIN_BYTES``, marking it in ``headers``."""
+    if len(body) <= GZIP_MIN_BYTES:
+        return body
+    headers['Content-Encoding'] = 'gzip'
+    return gzip.compress(body, compresslevel=6)
+
+
+@functools.lru_cache(maxsize=256)
+def _iso_cached(dt: datetime, offset: Optional[timedelta]) -> str:
+    return dt.isoformat(timespec='seconds')
+
+
+def _iso(dt: datetime) -> str:
+    """
+    Format a datetime for a query parameter, to whole seconds.
+    
+    Results are memoized, since the same window is usually passed to many
+    calls. Aware datetimes for the same instant in different zones compare
+    equal, so the UTC offset is part of the cache key.
+    """
+    return _iso_cached(dt, dt.utcoffset())
+
+
+# Interval members (and their string values) mapped to the wire value
+_INTERVAL_STR: Dict[Union[Interval, str], str] = {e: e.value for e in Interval}
+_INTERVAL_5M = Interval.FIVE_MINUTES.value
+
+
+def _encode_query(params: dict) -> str:
+    """Encode query parameters, skipping None values and expanding sequences."""
+    return urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+
+
+def _api_error(response: Any) -> StarlinkAPIError:
+    """
+    Build the exception for an unsuccessful response.
+    
+    Works with any response exposing ``status_code``, ``headers``,
+    ``content`` and ``text`` (requests and httpx alike).
+    """
+    try:
+        error_detail = _loads(response.content)
+    except ValueError:
+        error_detail = response.text
+    
+    if response.status_code == 429:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        return RateLimitError(
+            retry_after=math.ceil(retry_after) if retry_after is not None else None,
+            detail=error_detail
+        )
+    
+    return StarlinkAPIError(
+        f"API request failed: {response.status_code}",
+        status_code=response.status_code,
+        detail=error_detail
+    )
+
+
+def _fields_param(fields: Sequence[str]) -> str:
+    """Encode a field projection, always including the terminal ID."""
+    return ','.join(dict.fromkeys(['terminal_id', *fields]))
 
 
 class StarlinkClient:
@@ -37,7 +195,7 @@ class StarlinkClient:
     - Type-safe API methods
     - Environment-based URL configuration
     - Comprehensive error handling
-    - Stateless HTTP requests for backend-to-backend communication
+    - Persistent HTTP session with connection keep-alive
     
     Usage:
         from starlink_sdk import StarlinkClient
@@ -51,6 +209,12 @@ class StarlinkClient:
         
         health = client.fleet.get_health(from_time=..., to_time=...)
         terminals = client.terminals.list()
+        
+        # Release pooled connections when done
+        client.close()
+        # or
+        with StarlinkClient() as client:
+            ...
     """
     
     # Environment URL mappings
@@ -68,6 +232,15 @@ class StarlinkClient:
         api_secret: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        backoff_factor: float = 0.2,
+        rate_limit_rpm: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_scheduler: Optional[ATBScheduler] = None,
+        cache_ttl: Optional[float] = 30.0,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        pool_block: bool = True,
     ):
         """
         Initialize the Starlink client.
@@ -77,7 +250,30 @@ class StarlinkClient:
                         Defaults to STARLINK_ENVIRONMENT env var or 'production'
             api_secret: API secret (defaults to STARLINK_API_SECRET env var)
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retries for failed requests
+            max_retries: Maximum number of retries for connection errors and
+                        transient 5xx responses (with exponential backoff)
+            backoff_factor: Base delay in seconds for the transport's exponential
+                           retry backoff (Retry-After takes precedence when sent)
+            rate_limit_rpm: Server quota in requests per minute; when set, requests
+                           (retries included) are paced client-side (and synced with
+                           x-ratelimit-* response headers) instead of hitting HTTP 429
+            rate_limit_burst: Maximum back-to-back requests allowed by the rate limiter
+            retry_scheduler: Congestion-aware scheduler used to retry HTTP 429
+                            responses; without one, 429s are retried by the transport,
+                            honoring Retry-After
+            cache_ttl: Seconds to cache health checks and small first-page list
+                      results; None or 0 disables the response cache. Cached
+                      results are shared between callers and must not be mutated
+            session: HTTP session to send requests with (defaults to a new
+                    session owned and closed by this client); an injected
+                    session keeps its own adapters and retry configuration,
+                    and retries made by its adapters bypass the rate limiter
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Keep-alive connections kept per host; size it to the number
+                         of concurrent calls (e.g. BatchExecutor workers) so parallel
+                         requests don't open and discard extra connections
+            pool_block: Make calls beyond ``pool_maxsize`` wait for a free
+                       connection instead of opening one that is discarded afterwards
         """
         # Determine environment
         env = (
@@ -95,17 +291,76 @@ class StarlinkClient:
         
         self.environment = env
         self.base_url = self.ENVIRONMENT_URLS[env].rstrip('/')
+        self._url_cache: dict[str, str] = {}
+        self._query_cache: dict[tuple, str] = {}
+        # (auth header it was built from, base + auth headers), rebuilt per token
+        self._request_headers: tuple = (None, {})
         self.timeout = timeout
-        print(f"Using Starlink API base URL: {self.base_url}")
+        logger.debug("Using Starlink API base URL: %s", self.base_url)
         
-        # Initialize token manager
+        # One session per client so requests reuse pooled keep-alive connections
+        self._owns_session = session is None
+        self._session = session if session is not None else requests.Session()
+        # Statuses retried by _make_request rather than the adapter
+        self._retry_statuses: frozenset = frozenset()
+        if self._owns_session:
+            if rate_limit_rpm:
+                # The rate limiter must admit every attempt, so the adapter
+                # only retries connection errors and statuses are resent
+                # through _send
+                retry = Retry(
+                    total=max_retries,
+                    status=0,
+                    backoff_factor=backoff_factor,
+                    allowed_methods=RETRY_METHODS,
+                    raise_on_status=False,
+                )
+                self._retry_statuses = RETRY_STATUS_CODES
+            else:
+                if retry_scheduler is None:
+                    retry_cls, status_forcelist = Retry, RETRY_STATUS_CODES
+                else:
+                    retry_cls, status_forcelist = _ScheduledRetry, RETRY_STATUS_CODES - {429}
+                retry = retry_cls(
+                    total=max_retries,
+                    backoff_factor=backoff_factor,
+                    status_forcelist=status_forcelist,
+                    allowed_methods=RETRY_METHODS,
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=retry,
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+        
+        # Initialize token manager (token refreshes share the same connections)
         self.token_manager = TokenManager(
             base_url=self.base_url,
             api_secret=api_secret,
-            timeout=timeout
+            timeout=timeout,
+            session=self._session
         )
         
         self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        
+        # Client-side admission gate, shared by every request this client makes
+        self._bucket: Optional[TokenBucket] = (
+            TokenBucket(rate_limit_rpm, burst=rate_limit_burst)
+            if rate_limit_rpm
+            else None
+        )
+        self.retry_scheduler = retry_scheduler
+        
+        # Short-lived cache for repeated discovery-style GETs
+        self._cache: Optional[TTLCache] = (
+            TTLCache(maxsize=256, ttl=cache_ttl) if cache_ttl else None
+        )
         
         # Initialize API namespaces
         self.fleet = FleetAPI(self)
@@ -119,17 +374,27 @@ class StarlinkClient:
         endpoint: str, 
         params: Optional[dict] = None,
         json: Optional[dict] = None,
+        data: Optional[bytes] = None,
         headers: Optional[dict] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
-        Make an authenticated HTTP request with retry logic.
+        Make an authenticated HTTP request.
+        
+        Connection errors and transient 5xx responses are retried by the
+        session's adapter; this method re-authenticates on HTTP 401 and,
+        with a retry scheduler, retries HTTP 429. With ``rate_limit_rpm``
+        set, transient statuses are retried here instead, so the rate
+        limiter admits every attempt.
         
         Args:
             method: HTTP method
             endpoint: API endpoint (without base URL)
             params: Query parameters
             json: JSON body
+            data: Pre-encoded JSON body (used when ``json`` is not given)
             headers: Additional headers
+            stream: Defer downloading the body until it is read
             
         Returns:
             HTTP response
@@ -138,71 +403,212 @@ class StarlinkClient:
             StarlinkAPIError: For API-specific errors
             StarlinkClientError: For client-side errors
         """
-        print(f"Making {method} request to endpoint: {endpoint}")
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        logger.debug("Making %s request to endpoint: %s", method, endpoint)
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            if len(self._url_cache) < URL_CACHE_SIZE:
+                self._url_cache[endpoint] = url
+        
+        # Encode the query once here rather than on every attempt in requests;
+        # full URLs are cached per parameter set, which repeats across
+        # per-terminal loops over the same time window
+        if params:
+            key = (endpoint, tuple(params.items()))
+            # Cursors are one-off, so paging doesn't fill the cache
+            cacheable = 'cursor' not in params
+            try:
+                full_url = self._query_cache.get(key)
+            except TypeError:  # unhashable values (e.g. lists)
+                full_url = None
+                cacheable = False
+            if full_url is None:
+                full_url = f"{url}?{_encode_query(params)}"
+                if cacheable and len(self._query_cache) < URL_CACHE_SIZE:
+                    self._query_cache[key] = full_url
+            url = full_url
+        
+        # Serialize the body once, outside the loop
+        body = data
+        if json is not None:
+            body = _dumps(json)
         
-        # Get authentication header
+        # Base and auth headers are merged once per token; the merged dict is
+        # sent as is unless there is something to add (it must never be mutated)
         auth_header = self.token_manager.get_auth_header()
+        auth_source, default_headers = self._request_headers
+        if auth_source is not auth_header:
+            default_headers = {**BASE_HEADERS, **auth_header}
+            self._request_headers = (auth_header, default_headers)
         
-        # Merge headers
-        request_headers = {**auth_header}
-        if headers:
-            request_headers.update(headers)
+        if headers or body is not None:
+            request_headers = {**default_headers}
+            if headers:
+                request_headers.update(headers)
+            if body is not None:
+                request_headers['Content-Type'] = 'application/json'
+        else:
+            request_headers = default_headers
         
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    headers=request_headers,
-                    timeout=self.timeout
+        response = self._send(method, url, body, request_headers, stream)
+        if response.ok:
+            return response
+        
+        if response.status_code == 401:
+            # The cached token was rejected: fetch a new one and retry once.
+            # Responses are closed before resending so a streamed body
+            # returns its connection to the pool
+            response.close()
+            self.token_manager.invalidate(auth_header)
+            request_headers = {**request_headers, **self.token_manager.get_auth_header()}
+            response = self._send(method, url, body, request_headers, stream)
+            if response.status_code == 401:
+                response.close()
+                raise AuthenticationError(
+                    "Request rejected with HTTP 401 after refreshing the access token"
                 )
-                
-                # Check for success
-                if response.ok:
-                    return response
-                
-                # Handle specific error codes
-                if response.status_code == 401:
-                    # Token might be expired, let token manager handle refresh
-                    auth_header = self.token_manager.get_auth_header()
-                    request_headers.update(auth_header)
-                    continue
-                
-                # Raise for other HTTP errors
-                response.raise_for_status()
-                
-            except requests.HTTPError as e:
-                error_detail = None
-                try:
-                    error_detail = e.response.json()
-                except:
-                    error_detail = e.response.text
-                
-                raise StarlinkAPIError(
-                    f"API request failed: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                    detail=error_detail
-                ) from e
+        
+        # Throttled or transiently failing: wait as long as the scheduler (or
+        # Retry-After, or the backoff) says and send again through the limiter
+        scheduler = self.retry_scheduler
+        attempt = 0
+        while attempt < self.max_retries and (
+            (response.status_code == 429 and scheduler is not None)
+            or response.status_code in self._retry_statuses
+        ):
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            response.close()
+            if response.status_code == 429 and scheduler is not None:
+                delay = scheduler.next_delay(attempt, retry_after)
+            elif retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(self.backoff_factor * 2 ** attempt, Retry.DEFAULT_BACKOFF_MAX)
+            time.sleep(delay)
+            attempt += 1
+            response = self._send(method, url, body, request_headers, stream)
+        
+        if response.ok:
+            return response
+        raise _api_error(response)
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: dict,
+        stream: bool,
+    ) -> requests.Response:
+        """Send one request through the rate limiter, recording its outcome."""
+        if self._bucket is not None:
+            self._bucket.acquire()
+        
+        try:
+            response = self._session.request(
+                method=method,
+                url=url,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream
+            )
+        except requests.RequestException as e:
+            if self._owns_session:
+                # The adapter has already retried connection failures
+                raise StarlinkClientError(f"Request failed after {self.max_retries} retries: {str(e)}") from e
+            raise StarlinkClientError(f"Request failed: {str(e)}") from e
+        
+        # Keep the local bucket in step with the server's quota headers
+        if self._bucket is not None:
+            self._bucket.update_from_headers(response.headers)
+        if self.retry_scheduler is not None:
+            self.retry_scheduler.record(response.status_code == 429)
+        return response
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session if this client created it."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> "StarlinkClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _get_cached(self, endpoint: str, params: dict, model: Type[T]) -> T:
+        """
+        GET an endpoint and parse it into a model, serving repeats from the cache.
+        
+        Cached models are the same objects on every hit; callers must not
+        mutate them.
+        
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            model: Response model class
             
-            except requests.RequestException as e:
-                if attempt == self.max_retries:
-                    raise StarlinkClientError(f"Request failed after {self.max_retries} retries: {str(e)}") from e
-                # Continue to retry
+        Returns:
+            Parsed response
+        """
+        def fetch() -> T:
+            response = self._make_request('GET', endpoint, params=params)
+            return model.model_validate_json(response.content)
         
-        raise StarlinkClientError(f"Request failed after {self.max_retries} retries")
+        if self._cache is None:
+            return fetch()
+        return self._cache.get_or_fetch(('GET', endpoint, frozenset(params.items())), fetch)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
     
+    @ttl_cached(ttl=15)
     def health_check(self) -> dict:
         """
         Check API health status.
         
+        Results are cached for up to 15 seconds (or ``cache_ttl``, if shorter);
+        the returned dict is shared with later calls and must not be mutated.
+        
         Returns:
             Health check response
         """
         response = self._make_request('GET', '/health')
-        return response.json()
+        return _loads(response.content)
+    
+    def stream_health(self) -> Iterator[dict]:
+        """
+        Follow API health over a single server-sent event stream.
+        
+        Each ``data:`` event is decoded and yielded as it arrives. Servers
+        without ``/health/stream`` (HTTP 404) get one ``health_check()``
+        result instead.
+        
+        Yields:
+            Health status updates
+        """
+        try:
+            response = self._make_request(
+                'GET',
+                '/health/stream',
+                headers={'Accept': 'text/event-stream'},
+                stream=True
+            )
+        except StarlinkAPIError as e:
+            if e.status_code != 404:
+                raise
+            yield self.health_check()
+            return
+        
+        try:
+            for line in response.iter_lines():
+                if line.startswith(b'data:'):
+                    yield _loads(line[5:].strip())
+        finally:
+            response.close()
     
     def get_api_info(self) -> dict:
         """
@@ -212,14 +618,17 @@ class StarlinkClient:
             API information
         """
         response = self._make_request('GET', '/')
-        return response.json()
+        return _loads(response.content)
 
 
 class FleetAPI:
     """Fleet management API methods."""
     
+    __slots__ = ('client', '_req')
+    
     def __init__(self, client: StarlinkClient):
         self.client = client
+        self._req = client._make_request
     
     def get_health(
         self, 
@@ -237,25 +646,30 @@ class FleetAPI:
             Fleet health response
         """
         params = {
-            'from': from_time.isoformat(),
-            'to': to_time.isoformat()
+            'from': _iso(from_time),
+            'to': _iso(to_time)
         }
         
-        response = self.client._make_request('GET', '/v1/fleet/health', params=params)
-        return FleetHealthResponse(**response.json())
+        response = self._req('GET', '/v1/fleet/health', params=params)
+        return FleetHealthResponse.model_validate_json(response.content)
 
 
 class TerminalsAPI:
     """Terminal management API methods."""
     
+    __slots__ = ('client', '_req')
+    
     def __init__(self, client: StarlinkClient):
         self.client = client
+        self._req = client._make_request
     
     def list(
         self,
         status: Optional[Union[TerminalStatus, str]] = None,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        validate: bool = True
     ) -> TerminalListResponse:
         """
         List terminals for an account.
@@ -264,19 +678,66 @@ class TerminalsAPI:
             status: Filter by terminal status
             limit: Maximum number of results (1-500)
             cursor: Pagination cursor
+            fields: Only return these terminal fields (``terminal_id`` is
+                    always included; the rest are left as None)
+            validate: Validate the response; False skips pydantic validation
+                      for trusted high-volume reads and bypasses the cache
+                      (see ``TerminalListResponse.from_trusted``)
             
         Returns:
             Terminal list response
         """
-        params = {'limit': min(max(limit, 1), 500)}
+        params: Dict[str, Any] = {'limit': min(max(limit, 1), 500)}
         
         if status:
-            params['status'] = status if isinstance(status, str) else status.value
+            params['status'] = status
+        if fields:
+            params['fields'] = _fields_param(fields)
         if cursor:
             params['cursor'] = cursor
+        elif validate and params['limit'] <= CACHEABLE_LIST_LIMIT:
+            return self.client._get_cached('/v1/terminals', params, TerminalListResponse)
         
-        response = self.client._make_request('GET', '/v1/terminals', params=params)
-        return TerminalListResponse(**response.json())
+        response = self._req('GET', '/v1/terminals', params=params)
+        if not validate:
+            return TerminalListResponse.from_trusted(_loads(response.content))
+        return TerminalListResponse.model_validate_json(response.content)
+    
+    def iter_list(
+        self,
+        status: Optional[Union[TerminalStatus, str]] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[TerminalSummary]:
+        """
+        Iterate over all terminals, parsing each page incrementally.
+        
+        Items are yielded as soon as they are parsed from the response body,
+        and pages are followed until the last one. Requires ``ijson``.
+        
+        Args:
+            status: Filter by terminal status
+            limit: Page size (1-500)
+            fields: Only return these terminal fields (see ``list``)
+            
+        Yields:
+            Terminal summaries
+        """
+        params: Dict[str, Any] = {'limit': min(max(limit, 1), 500)}
+        
+        if status:
+            params['status'] = status
+        if fields:
+            params['fields'] = _fields_param(fields)
+        
+        while True:
+            response = self._req('GET', '/v1/terminals', params=params, stream=True)
+            page = StreamedPage(response, TerminalSummary)
+            yield from page
+            
+            if not page.next_cursor:
+                break
+            params['cursor'] = page.next_cursor
     
     def get(self, terminal_id: str) -> TerminalSummary:
         """
@@ -288,16 +749,17 @@ class TerminalsAPI:
         Returns:
             Terminal summary response
         """
-        response = self.client._make_request('GET', f'/v1/terminals/{terminal_id}')
-        return TerminalSummary(**response.json())
+        response = self._req('GET', _TERMINAL_PATH % terminal_id)
+        return TerminalSummary.model_validate_json(response.content)
     
     def get_metrics(
         self,
         terminal_id: str,
         from_time: datetime,
         to_time: datetime,
-        interval: Union[Interval, str] = Interval.FIVE_MINUTES,
-        metrics: Optional[List[str]] = None
+        interval: Union[Interval, str] = _INTERVAL_5M,
+        metrics: Optional[List[str]] = None,
+        validate: bool = True
     ) -> MetricsResponse:
         """
         Get time-series metrics for a terminal.
@@ -306,30 +768,113 @@ class TerminalsAPI:
             terminal_id: Terminal identifier
             from_time: Start time (inclusive)
             to_time: End time (exclusive)
-            interval: Aggregation interval
+            interval: Aggregation interval (default 5 minutes)
             metrics: List of metric keys to retrieve
+            validate: Validate the response; False skips pydantic validation
+                      for trusted high-volume reads (see
+                      ``MetricsResponse.from_trusted``)
             
         Returns:
             Metrics response
         """
         params = {
-            'from': from_time.isoformat(),
-            'to': to_time.isoformat(),
-            'interval': interval if isinstance(interval, str) else interval.value
+            'from': _iso(from_time),
+            'to': _iso(to_time),
+            'interval': _INTERVAL_STR.get(interval, interval)
+        }
+        
+        if metrics:
+            params['metrics'] = ','.join(metrics)
+        
+        response = self._req('GET', _TERMINAL_METRICS_PATH % terminal_id, params=params)
+        if not validate:
+            return MetricsResponse.from_trusted(_loads(response.content))
+        return MetricsResponse.model_validate_json(response.content)
+    
+    def get_metrics_arrays(
+        self,
+        terminal_id: str,
+        from_time: datetime,
+        to_time: datetime,
+        interval: Union[Interval, str] = _INTERVAL_5M,
+        metrics: Optional[List[str]] = None
+    ) -> dict[str, MetricSeries]:
+        """
+        Get time-series metrics for a terminal as NumPy arrays.
+        
+        Equivalent to ``get_metrics(...).to_arrays()``, but the decoded
+        points go straight into arrays without building ``MetricPoint``
+        models. Requires ``numpy``.
+        
+        Args:
+            terminal_id: Terminal identifier
+            from_time: Start time (inclusive)
+            to_time: End time (exclusive)
+            interval: Aggregation interval (default 5 minutes)
+            metrics: List of metric keys to retrieve
+            
+        Returns:
+            Mapping of metric name to metric series
+        """
+        params = {
+            'from': _iso(from_time),
+            'to': _iso(to_time),
+            'interval': _INTERVAL_STR.get(interval, interval)
+        }
+        
+        if metrics:
+            params['metrics'] = ','.join(metrics)
+        
+        response = self._req('GET', _TERMINAL_METRICS_PATH % terminal_id, params=params)
+        series = _loads(response.content)['series']
+        return {name: MetricSeries.from_json(points) for name, points in series.items()}
+    
+    def iter_metrics(
+        self,
+        terminal_id: str,
+        from_time: datetime,
+        to_time: datetime,
+        interval: Union[Interval, str] = _INTERVAL_5M,
+        metrics: Optional[List[str]] = None
+    ) -> Iterator[tuple[str, MetricPoint]]:
+        """
+        Iterate over a terminal's metric points, parsing the response incrementally.
+        
+        Points are yielded as soon as they are parsed from the response
+        body, so long windows never hold the whole series in memory.
+        Requires ``ijson``.
+        
+        Args:
+            terminal_id: Terminal identifier
+            from_time: Start time (inclusive)
+            to_time: End time (exclusive)
+            interval: Aggregation interval (default 5 minutes)
+            metrics: List of metric keys to retrieve
+            
+        Yields:
+            ``(metric name, point)`` pairs
+        """
+        params = {
+            'from': _iso(from_time),
+            'to': _iso(to_time),
+            'interval': _INTERVAL_STR.get(interval, interval)
         }
         
         if metrics:
             params['metrics'] = ','.join(metrics)
         
-        response = self.client._make_request('GET', f'/v1/terminals/{terminal_id}/metrics', params=params)
-        return MetricsResponse(**response.json())
+        response = self._req('GET', _TERMINAL_METRICS_PATH % terminal_id, params=params, stream=True)
+        yield from iter_series(response, MetricPoint)
 
 
 class AlertsAPI:
     """Alert management API methods."""
     
+    __slots__ = ('client', '_req')
+    
     def __init__(self, client: StarlinkClient):
         self.client = client
+        self._req = client._make_request
     
     def list(
         self,
@@ -339,7 +884,8 @@ class AlertsAPI:
         from_time: Optional[datetime] = None,
         to_time: Optional[datetime] = None,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        validate: bool = True
     ) -> AlertsListResponse:
         """
         List alerts with filtering options.
@@ -352,6 +898,9 @@ class AlertsAPI:
             to_time: Filter by creation time (end)
             limit: Maximum number of results (1-500)
             cursor: Pagination cursor
+            validate: Validate the response; False skips pydantic validation
+                      for trusted high-volume reads and bypasses the cache
+                      (see ``AlertsListResponse.from_trusted``)
             
         Returns:
             Alerts list response
@@ -359,25 +908,77 @@ class AlertsAPI:
         params = {'limit': min(max(limit, 1), 500)}
         
         if status:
-            params['status'] = status if isinstance(status, str) else status.value
+            params['status'] = status
         if severity:
-            params['severity'] = severity if isinstance(severity, str) else severity.value
+            params['severity'] = severity
         if terminal_id:
             params['terminal_id'] = terminal_id
         if from_time:
-            params['from'] = from_time.isoformat()
+            params['from'] = _iso(from_time)
         if to_time:
-            params['to'] = to_time.isoformat()
+            params['to'] = _iso(to_time)
         if cursor:
             params['cursor'] = cursor
+        elif validate and params['limit'] <= CACHEABLE_LIST_LIMIT:
+            return self.client._get_cached('/v1/alerts', params, AlertsListResponse)
         
-        response = self.client._make_request('GET', '/v1/alerts', params=params)
-        return AlertsListResponse(**response.json())
+        response = self._req('GET', '/v1/alerts', params=params)
+        if not validate:
+            return AlertsListResponse.from_trusted(_loads(response.content))
+        return AlertsListResponse.model_validate_json(response.content)
+    
+    def iter_list(
+        self,
+        status: Optional[Union[AlertStatus, str]] = None,
+        severity: Optional[Union[AlertSeverity, str]] = None,
+        terminal_id: Optional[str] = None,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Iterator[Alert]:
+        """
+        Iterate over all matching alerts, parsing each page incrementally.
+        
+        Items are yielded as soon as they are parsed from the response body,
+        and pages are followed until the last one. Requires ``ijson``.
+        
+        Args:
+            status: Filter by alert status (optional)
+            severity: Filter by severity
+            terminal_id: Filter by terminal
+            from_time: Filter by creation time (start)
+            to_time: Filter by creation time (end)
+            limit: Page size (1-500)
+            
+        Yields:
+            Alerts
+        """
+        params: Dict[str, Any] = {'limit': min(max(limit, 1), 500)}
+        
+        if status:
+            params['status'] = status
+        if severity:
+            params['severity'] = severity
+        if terminal_id:
+            params['terminal_id'] = terminal_id
+        if from_time:
+            params['from'] = _iso(from_time)
+        if to_time:
+            params['to'] = _iso(to_time)
+        
+        while True:
+            response = self._req('GET', '/v1/alerts', params=params, stream=True)
+            page = StreamedPage(response, Alert)
+            yield from page
+            
+            if not page.next_cursor:
+                break
+            params['cursor'] = page.next_cursor
     
     def update(
         self,
         alert_id: str,
-        status: str,
+        status: Union[AlertStatus, str, dict, AlertUpdateRequest],
         idempotency_key: Optional[str] = None
     ) -> AlertUpdateResponse:
         """
@@ -385,7 +986,8 @@ class AlertsAPI:
         
         Args:
             alert_id: Alert identifier
-            status: New status for the alert (e.g., "acknowledged", "resolved", "open")
+            status: New status for the alert (e.g., "acknowledged", "resolved", "open"),
+                    or a full update as a dict or AlertUpdateRequest
             idempotency_key: Optional idempotency key for request deduplication
             
         Returns:
@@ -394,30 +996,40 @@ class AlertsAPI:
         Example:
             response = client.alerts.update("alert_123", "acknowledged")
         """
-        # Create the AlertUpdateRequest object internally
-        try:
-            update_request = AlertUpdateRequest(status=status)
-        except Exception as e:
-            raise StarlinkClientError(f"Invalid status '{status}': {e}")
+        # Validate once; an AlertUpdateRequest is already validated
+        if isinstance(status, AlertUpdateRequest):
+            update_request = status
+        else:
+            try:
+                if isinstance(status, dict):
+                    update_request = AlertUpdateRequest.model_validate(status)
+                else:
+                    update_request = AlertUpdateRequest(status=status)
+            except Exception as e:
+                raise StarlinkClientError(f"Invalid status '{status}': {e}") from e
         
         headers = {}
         if idempotency_key:
             headers['Idempotency-Key'] = idempotency_key
         
-        response = self.client._make_request(
+        response = self._req(
             'PATCH', 
-            f'/v1/alerts/{alert_id}',
-            json=update_request.model_dump(mode='json'),
+            _ALERT_PATH % alert_id,
+            data=update_request.model_dump_json(exclude_none=True).encode('utf-8'),
             headers=headers if headers else None
         )
-        return AlertUpdateResponse(**response.json())
+        self.client.invalidate_cache()
+        return AlertUpdateResponse.model_validate_json(response.content)
 
 
 class TelemetryAPI:
     """Telemetry ingestion API methods."""
     
+    __slots__ = ('client', '_req')
+    
     def __init__(self, client: StarlinkClient):
         self.client = client
+        self._req = client._make_request
     
     def ingest(
         self,
@@ -427,6 +1039,8 @@ class TelemetryAPI:
         """
         Ingest telemetry data for a terminal.
         
+        Bodies larger than ``GZIP_MIN_BYTES`` are sent gzip-compressed.
+        
         Args:
             request: Telemetry ingest request
             idempotency_key: Unique key for request idempotency
@@ -436,13 +1050,42 @@ class TelemetryAPI:
         """
         headers = {'Idempotency-Key': idempotency_key}
         
-        response = self.client._make_request(
+        body = _gzip_body(request.to_bytes(), headers)
+        
+        response = self._req(
             'POST', 
             '/v1/telemetry', 
-            json=request.model_dump(mode='json'),
+            data=body,
             headers=headers
         )
-        return TelemetryIngestResponse(**response.json())
+        self.client.invalidate_cache()
+        return TelemetryIngestResponse.model_validate_json(response.content)
+
+
+# Clients handed out by create_client, keyed by their configuration
+_clients: dict = {}
+_clients_lock = threading.Lock()
+
+
+def _forget_clients() -> None:
+    """Drop clients inherited from the parent process (runs in a forked child)."""
+    global _clients_lock
+    # The parent's sessions hold its sockets; the child must open its own.
+    # The lock may have been held by another thread at fork time.
+    _clients_lock = threading.Lock()
+    _clients.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_clients)
+
+
+def _close_clients() -> None:
+    """Close every client created by create_client (registered with atexit)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
 
 
 # Convenience function for creating a client
@@ -454,6 +1097,13 @@ def create_client(
     """
     Create and return a configured Starlink client.
     
+    Clients are created lazily and reused: repeated calls with the same
+    arguments return the same instance, so its pooled connections and
+    authentication token carry over instead of being re-established.
+    Shared clients are closed automatically at interpreter exit, and a
+    forked child process starts with none (it never reuses the parent's
+    connections).
+    
     Args:
         environment: Environment name (production, staging, development, demo, local)
         api_secret: API secret
@@ -462,4 +1112,18 @@ def create_client(
     Returns:
         Configured client instance
     """
-    return StarlinkClient(environment=environment, api_secret=api_secret, **kwargs)
\ No newline at end of file
+    key = (environment, api_secret, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Options that can't be used as a cache key get a dedicated client
+        return StarlinkClient(environment=environment, api_secret=api_secret, **kwargs)
+    
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if not _clients:
+                atexit.register(_close_clients)
+            client = StarlinkClient(environment=environment, api_secret=api_secret, **kwargs)
+            _clients[key] = client
+    return client
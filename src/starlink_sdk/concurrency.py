@@ -0,0 +1,329 @@
+"""Helpers for running Starlink API calls concurrently."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .exceptions import RateLimitError, StarlinkAPIError
+
+# Status codes treated as congestion signals by the AIMD limiter
+CONGESTION_STATUS_CODES = frozenset({429, 502, 503})
+
+
+class AIMDLimiter:
+    """
+    Additive-increase/multiplicative-decrease concurrency limiter.
+
+    Concurrency grows by ``alpha`` while the average latency stays at or below
+    ``target_latency`` and is multiplied by ``beta`` on congestion signals
+    (HTTP 429/502/503 or a failed connection), so batch work settles near the
+    server's capacity instead of provoking retry storms.
+
+    Usage:
+        limiter = AIMDLimiter(target_latency=0.5)
+        with limiter:
+            start = time.perf_counter()
+            response = client.terminals.get(terminal_id)
+            limiter.on_result(time.perf_counter() - start, 200)
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 1.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        c_min: int = 1,
+        c_max: int = 64,
+        initial: Optional[int] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            target_latency: Average latency (seconds) below which concurrency grows
+            alpha: Additive increase applied per fast, successful call
+            beta: Multiplicative decrease applied per congestion signal
+            c_min: Minimum concurrency
+            c_max: Maximum concurrency
+            initial: Starting concurrency (defaults to ``c_min``)
+        """
+        if not 1 <= c_min <= c_max:
+            raise ValueError("Require 1 <= c_min <= c_max")
+        if not 0 < beta < 1:
+            raise ValueError("beta must be between 0 and 1")
+
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.beta = beta
+        self.c_min = c_min
+        self.c_max = c_max
+
+        self._limit = float(min(max(initial or c_min, c_min), c_max))
+        self._avg_latency: Optional[float] = None
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def current(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently admitted."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot is free."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Release a concurrency slot."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_result(self, latency: float, status: Optional[int]) -> None:
+        """
+        Record the outcome of a call and adjust concurrency.
+
+        Args:
+            latency: Call duration in seconds
+            status: HTTP status code, or None if the call failed without one
+        """
+        with self._cond:
+            if self._avg_latency is None:
+                self._avg_latency = latency
+            else:
+                self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+
+            if status is None or status in CONGESTION_STATUS_CODES:
+                self._limit = max(float(self.c_min), self._limit * self.beta)
+            elif self._avg_latency <= self.target_latency:
+                self._limit = min(float(self.c_max), self._limit + self.alpha)
+
+            self._cond.notify_all()
+
+    def __enter__(self) -> "AIMDLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class BatchExecutor:
+    """
+    Run SDK calls concurrently on a bounded pool of worker threads.
+
+    The client is synchronous, so fan-out across many terminals is done with
+    threads. Bounding the pool keeps bursts from overwhelming the API; pair it
+    with a client created with ``rate_limit_rpm`` so every request is also
+    admitted through the client's token bucket. Passing an ``AIMDLimiter``
+    makes the number of calls in flight adapt to observed latency and errors.
+
+    Usage:
+        client = StarlinkClient(rate_limit_rpm=600)
+        with BatchExecutor(max_workers=8) as executor:
+            details = executor.map(client.terminals.get, terminal_ids)
+    """
+
+    def __init__(self, max_workers: int = 8, limiter: Optional[AIMDLimiter] = None):
+        """
+        Initialize the batch executor.
+
+        Args:
+            max_workers: Maximum number of calls in flight at once
+                         (ignored in favour of ``limiter.c_max`` when a limiter is given)
+            limiter: Optional adaptive concurrency limiter
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.limiter = limiter
+        self.max_workers = limiter.c_max if limiter else max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="starlink-batch",
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule a single call.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            Future for the call's result
+        """
+        if self.limiter is not None:
+            return self._pool.submit(self._run_limited, self.limiter, fn, *args, **kwargs)
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def _run_limited(
+        self, limiter: AIMDLimiter, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a call inside the limiter, reporting its latency and outcome."""
+        with limiter:
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except StarlinkAPIError as e:
+                limiter.on_result(time.perf_counter() - start, e.status_code)
+                raise
+            except Exception:
+                # Connection failures, invalid responses and errors in ``fn``
+                # itself must not grow the window
+                limiter.on_result(time.perf_counter() - start, None)
+                raise
+            limiter.on_result(time.perf_counter() - start, 200)
+            return result
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        Call ``fn`` for every item concurrently.
+
+        Args:
+            fn: Callable taking a single item
+            items: Items to process
+            return_exceptions: If True, exceptions are returned in place of
+                               results; otherwise the first one is raised
+
+        Returns:
+            Results in the same order as ``items``
+        """
+        futures = [self.submit(fn, item) for item in items]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def close(self) -> None:
+        """Wait for in-flight calls and release the worker threads."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BatchExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class RateAwareGather:
+    """
+    Run independent calls concurrently, pausing them all on a rate limit.
+
+    The first ``RateLimitError`` carrying ``retry_after`` holds back every
+    call that has not started yet until the server's quota resets, so one
+    throttled call does not send the rest of the batch into the same 429.
+
+    Usage:
+        with RateAwareGather(max_workers=4) as gather:
+            for name, future in gather.as_completed(calls):
+                try:
+                    future.result()
+                except RateLimitError:
+                    ...
+    """
+
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize the gatherer.
+
+        Args:
+            max_workers: Maximum number of calls in flight at once
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="starlink-gather",
+        )
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back calls that have not started for ``seconds``.
+
+        Args:
+            seconds: Delay before the next call may start
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait(self) -> None:
+        """Sleep until no pause is in effect."""
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def _run(self, fn: Callable[[], Any]) -> Any:
+        """Run a call once any pause has elapsed, pausing others on a 429."""
+        self._wait()
+        try:
+            return fn()
+        except RateLimitError as e:
+            if e.retry_after:
+                self.pause(e.retry_after)
+            raise
+
+    def as_completed(
+        self,
+        calls: Mapping[Hashable, Callable[[], Any]],
+    ) -> Iterator[Tuple[Hashable, Future]]:
+        """
+        Start every call and yield them as they finish.
+
+        Args:
+            calls: Zero-argument callables keyed by a caller-chosen label
+
+        Yields:
+            Tuples of (label, completed future)
+        """
+        futures = {self._pool.submit(self._run, fn): key for key, fn in calls.items()}
+        for future in as_completed(futures):
+            yield futures[future], future
+
+    def close(self) -> None:
+        """Wait for in-flight calls and release the worker threads."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "RateAwareGather":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,10 +1,27 @@
 """Data models for the Starlink Enterprise Dashboard API."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _require_numpy() -> Any:
+    """Import NumPy, raising a helpful error if it is not installed."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for array-backed metrics; "
+            "install it with `pip install starlink-sdk[numpy]`"
+        ) from e
+    return numpy
 
 
 class AlertSeverity(str, Enum):
@@ -73,6 +90,25 @@ class AlertsListResponse(BaseModel):
     items: List[Alert]
     next_cursor: Optional[str] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "AlertsListResponse":
+        """
+        Build the response from decoded JSON without validation.
+
+        Values are kept as decoded (timestamps stay ISO strings, enums
+        stay plain strings).
+
+        Args:
+            data: Decoded response body
+
+        Returns:
+            Alerts list response
+        """
+        return cls.model_construct(
+            items=[Alert.model_construct(**item) for item in data['items']],
+            next_cursor=data.get('next_cursor')
+        )
+
 
 class FleetCounts(BaseModel):
     """Fleet health counts."""
@@ -97,11 +133,16 @@ class FleetHealthResponse(BaseModel):
 
 
 class TerminalSummary(BaseModel):
-    """Terminal summary information."""
+    """
+    Terminal summary information.
+
+    Fields other than ``terminal_id`` are None when the list call selected
+    a subset of fields.
+    """
     terminal_id: str
-    health_status: HealthStatus
-    last_seen: datetime
-    status: TerminalStatus
+    health_status: Optional[HealthStatus] = None
+    last_seen: Optional[datetime] = None
+    status: Optional[TerminalStatus] = None
     name: Optional[str] = None
     location: Optional[Location] = None
 
@@ -111,6 +152,28 @@ class TerminalListResponse(BaseModel):
     items: List[TerminalSummary]
     next_cursor: Optional[str] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TerminalListResponse":
+        """
+        Build the response from decoded JSON without validation.
+
+        Values are kept as decoded (timestamps stay ISO strings, enums
+        stay plain strings).
+
+        Args:
+            data: Decoded response body
+
+        Returns:
+            Terminal list response
+        """
+        items = []
+        for item in data['items']:
+            location = item.get('location')
+            if location is not None:
+                item = {**item, 'location': Location.model_construct(**location)}
+            items.append(TerminalSummary.model_construct(**item))
+        return cls.model_construct(items=items, next_cursor=data.get('next_cursor'))
+
 
 class TerminalDetail(BaseModel):
     """Detailed terminal information."""
@@ -131,6 +194,98 @@ class MetricPoint(BaseModel):
     v: float = Field(description="Value")
 
 
+# Parses timestamps exactly as MetricPoint fields do (any fraction length,
+# "Z" suffix), which datetime.fromisoformat does not on Python 3.10
+_parse_datetime = TypeAdapter(datetime).validate_python
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Microseconds since the epoch, reading naive datetimes as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return round(dt.timestamp() * 1_000_000)
+
+
+class MetricSeries:
+    """
+    Column-oriented (structure-of-arrays) view of a single metric series.
+
+    Timestamps and values are held in two NumPy arrays instead of a list of
+    ``MetricPoint`` objects, so aggregations such as ``v.mean()`` run as
+    vectorized operations. Requires ``numpy``.
+    """
+
+    __slots__ = ("ts", "v")
+
+    def __init__(self, ts: Any, v: Any):
+        """
+        Initialize the series.
+
+        Args:
+            ts: ``datetime64[us]`` array of timestamps (UTC)
+            v: ``float64`` array of values
+        """
+        self.ts = ts
+        self.v = v
+
+    @classmethod
+    def from_points(cls, points: List["MetricPoint"]) -> "MetricSeries":
+        """
+        Build a series from metric points.
+
+        Args:
+            points: Metric points (naive timestamps are read as UTC)
+
+        Returns:
+            Metric series
+        """
+        np = _require_numpy()
+        count = len(points)
+        epoch_us = np.fromiter(
+            (_epoch_us(p.t) for p in points), dtype=np.int64, count=count
+        )
+        values = np.fromiter((p.v for p in points), dtype=np.float64, count=count)
+        return cls(epoch_us.astype("datetime64[us]"), values)
+
+    @classmethod
+    def from_json(cls, points: List[Dict[str, Any]]) -> "MetricSeries":
+        """
+        Build a series from decoded JSON points, without ``MetricPoint`` objects.
+
+        Args:
+            points: Decoded points (``{"t": <ISO 8601 string>, "v": <number>}``;
+                    timestamps without an offset are read as UTC)
+
+        Returns:
+            Metric series
+        """
+        np = _require_numpy()
+        count = len(points)
+        epoch_us = np.fromiter(
+            (_epoch_us(_parse_datetime(p['t'])) for p in points),
+            dtype=np.int64,
+            count=count
+        )
+        values = np.fromiter((p['v'] for p in points), dtype=np.float64, count=count)
+        return cls(epoch_us.astype("datetime64[us]"), values)
+
+    def points(self) -> List["MetricPoint"]:
+        """
+        Get the series as metric points (for code expecting the list form).
+
+        Returns:
+            List of metric points
+        """
+        epoch_us = self.ts.astype("int64").tolist()
+        return [
+            MetricPoint(t=datetime.fromtimestamp(us / 1_000_000, tz=timezone.utc), v=v)
+            for us, v in zip(epoch_us, self.v.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.v)
+
+
 class MetricsResponse(BaseModel):
     """Metrics response for a terminal."""
     terminal_id: str
@@ -139,6 +294,36 @@ class MetricsResponse(BaseModel):
     interval: Interval
     series: Dict[str, List[MetricPoint]]
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "MetricsResponse":
+        """
+        Build the response from decoded JSON without validation.
+
+        Values are kept as decoded (timestamps stay ISO strings), so
+        ``to_arrays`` needs a validated response.
+
+        Args:
+            data: Decoded response body
+
+        Returns:
+            Metrics response
+        """
+        construct = MetricPoint.model_construct
+        series = {
+            name: [construct(t=point['t'], v=point['v']) for point in points]
+            for name, points in data['series'].items()
+        }
+        return cls.model_construct(**{**data, 'series': series})
+
+    def to_arrays(self) -> Dict[str, MetricSeries]:
+        """
+        Convert every series to a NumPy-backed ``MetricSeries``.
+
+        Returns:
+            Mapping of metric name to metric series
+        """
+        return {name: MetricSeries.from_points(points) for name, points in self.series.items()}
+
 
 class TelemetryIngestRequest(BaseModel):
     """Request to ingest telemetry data."""
@@ -146,6 +331,28 @@ class TelemetryIngestRequest(BaseModel):
     timestamp: datetime
     metrics: Dict[str, Any]
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the request to a JSON body.
+
+        Uses orjson directly on the field values when it is installed
+        (NumPy scalars and arrays in ``metrics`` are supported), skipping
+        pydantic's serializer. Values orjson can't encode (e.g. ``Decimal``
+        or nested models) fall back to pydantic.
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    {'terminal_id': self.terminal_id, 'timestamp': self.timestamp, 'metrics': self.metrics},
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+                )
+            except orjson.JSONEncodeError:
+                pass
+        return self.model_dump_json().encode('utf-8')
+
 
 class TelemetryIngestResponse(BaseModel):
     """Response from telemetry ingestion."""
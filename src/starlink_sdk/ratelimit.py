@@ -0,0 +1,199 @@
+"""Client-side rate limiting for the Starlink Enterprise Dashboard API."""
+
+import re
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+
+from .retry import parse_retry_after
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _first_header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+    """Return the first header present among ``names``."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer header value, returning None if malformed."""
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit reset header into seconds from now.
+
+    Accepts delay-seconds (``"12"``), a Unix timestamp (``"1735300000"``),
+    or a duration string (``"1m30s"``, ``"250ms"``).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds until the quota resets, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        parts = _DURATION_RE.findall(value)
+        if not parts or "".join(n + u for n, u in parts) != value.strip():
+            return None
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    # Large values are absolute epoch timestamps rather than deltas
+    if seconds > 1e9:
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str]
+) -> Tuple[Optional[int], Optional[float], Optional[int]]:
+    """
+    Extract quota information from response headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Tuple of (remaining requests, seconds until reset, request limit)
+    """
+    remaining = _parse_int(_first_header(
+        headers, "x-ratelimit-remaining-requests", "x-ratelimit-remaining"
+    ))
+    limit = _parse_int(_first_header(
+        headers, "x-ratelimit-limit-requests", "x-ratelimit-limit"
+    ))
+    reset_after = parse_reset(_first_header(
+        headers, "x-ratelimit-reset-requests", "x-ratelimit-reset"
+    ))
+
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    if retry_after is not None:
+        remaining = 0
+        reset_after = max(reset_after or 0.0, retry_after)
+
+    return remaining, reset_after, limit
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to a known server quota.
+
+    Requests that would exceed the quota sleep locally instead of
+    round-tripping to the API only to receive HTTP 429.
+
+    Usage:
+        bucket = TokenBucket(rpm=600)
+        bucket.acquire()  # blocks until a request may be sent
+    """
+
+    def __init__(self, rpm: float, burst: Optional[int] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rpm: Allowed requests per minute
+            burst: Maximum number of requests that may be sent back-to-back
+                   (defaults to one second's worth of quota, at least 1)
+        """
+        if rpm <= 0:
+            raise ValueError("rpm must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rpm = rpm
+        self.rate = rpm / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (lock must be held)."""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Sync the bucket with the server's view of the quota.
+
+        The local token count never exceeds the server's remaining count, and
+        when only a couple of requests are left (and under 10% of the limit,
+        if known) the bucket pauses until the server-reported reset instead of
+        spending the last requests and receiving HTTP 429.
+
+        Args:
+            headers: Response headers carrying ``x-ratelimit-*`` / ``Retry-After``
+        """
+        remaining, reset_after, limit = parse_rate_limit_headers(headers)
+        if remaining is None:
+            return
+
+        low_watermark = 2 if limit is None else min(2, limit * 0.1)
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, float(remaining))
+
+            if reset_after is not None and remaining <= low_watermark:
+                self._tokens = 0.0
+                self._paused_until = max(self._paused_until, now + reset_after)
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available, without blocking.
+
+        Returns:
+            True if a token was taken, False otherwise
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return False
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        Returns:
+            Total time spent waiting, in seconds
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,171 @@
+"""Congestion-aware retry scheduling for the Starlink Enterprise Dashboard API."""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, Tuple
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ATBScheduler:
+    """
+    Adaptive throttling backoff (ATB) retry scheduler.
+
+    Instead of a fixed ``base * 2**attempt`` schedule, the scheduler keeps a
+    sliding window of recent attempts, estimates congestion from the share of
+    them that were throttled (HTTP 429), and draws each retry delay uniformly
+    from a window that widens with the estimated overload. Independent clients
+    sharing a quota therefore spread their retries out rather than colliding
+    again on the next tick.
+
+    Usage:
+        client = StarlinkClient(retry_scheduler=ATBScheduler())
+    """
+
+    def __init__(
+        self,
+        window: int = 100,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            window: Number of recent attempts used to estimate congestion
+            base_delay: Retry window (seconds) for the first retry with no congestion
+            max_delay: Upper bound on any single retry delay
+            rng: Random number generator (for reproducible schedules)
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._outcomes: deque = deque(maxlen=window)
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    def record(self, throttled: bool) -> None:
+        """
+        Record the outcome of a request attempt.
+
+        Args:
+            throttled: True if the attempt was answered with HTTP 429
+        """
+        with self._lock:
+            self._outcomes.append(throttled)
+
+    def snapshot(self) -> Tuple[int, int]:
+        """
+        Get the attempt and throttle counts in the current window.
+
+        Returns:
+            Tuple of (attempts, throttled)
+        """
+        with self._lock:
+            return len(self._outcomes), sum(self._outcomes)
+
+    @property
+    def congestion(self) -> float:
+        """Estimated share of attempts currently being throttled (0.0-1.0)."""
+        attempts, throttled = self.snapshot()
+        return throttled / attempts if attempts else 0.0
+
+    def next_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Draw the delay before the next retry.
+
+        Args:
+            attempt: Zero-based index of the attempt that was throttled
+            retry_after: Server-provided ``Retry-After`` delay, used as a lower bound
+
+        Returns:
+            Delay in seconds
+        """
+        # If a share p of attempts is rejected, demand exceeds capacity by
+        # roughly 1 / (1 - p); widen the retry window by the same factor.
+        congestion = min(self.congestion, 0.95)
+        overload = 1.0 / (1.0 - congestion)
+        window = self.base_delay * overload * (attempt + 1)
+
+        delay = self._rng.uniform(0.0, window)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.max_delay)
+
+
+class AATBScheduler(ATBScheduler):
+    """
+    Telemetry-aware ATB scheduler.
+
+    Extends ATB with congestion observed by other SDK instances, so a fleet of
+    clients sharing one quota can back off together. Publish each instance's
+    ``snapshot()`` through whatever channel the fleet already shares and feed
+    the aggregated counts back in with ``observe()``.
+    """
+
+    def __init__(self, *args: Any, decay: float = 0.5, **kwargs: Any):
+        """
+        Initialize the scheduler.
+
+        Args:
+            *args: Positional arguments for ``ATBScheduler``
+            decay: Weight kept by previous external observations on each update
+            **kwargs: Keyword arguments for ``ATBScheduler``
+        """
+        super().__init__(*args, **kwargs)
+        if not 0 <= decay < 1:
+            raise ValueError("decay must be between 0 and 1")
+
+        self.decay = decay
+        self._external_attempts = 0.0
+        self._external_throttled = 0.0
+
+    def observe(self, attempts: int, throttled: int) -> None:
+        """
+        Merge attempt/throttle counts reported by other clients.
+
+        Args:
+            attempts: Number of attempts observed externally
+            throttled: Number of those attempts that were throttled
+        """
+        with self._lock:
+            self._external_attempts = self._external_attempts * self.decay + attempts
+            self._external_throttled = self._external_throttled * self.decay + throttled
+
+    @property
+    def congestion(self) -> float:
+        """Estimated share of attempts throttled, locally and across the fleet."""
+        local_attempts, local_throttled = self.snapshot()
+        with self._lock:
+            attempts = local_attempts + self._external_attempts
+            throttled = local_throttled + self._external_throttled
+        return throttled / attempts if attempts else 0.0
@@ -0,0 +1,119 @@
+"""Incremental parsing of large list responses."""
+
+from typing import Any, Generic, Iterator, Optional, Tuple, Type, TypeVar
+
+import requests
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def _require_ijson() -> Any:
+    """Import ijson, raising a helpful error if it is not installed."""
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            "ijson is required for streaming responses; "
+            "install it with `pip install starlink-sdk[streaming]`"
+        ) from e
+    return ijson
+
+
+class StreamedPage(Generic[T]):
+    """
+    Items of a list response, parsed one at a time as bytes arrive.
+
+    Each item is validated into ``model`` as soon as its JSON object is
+    complete, so the full page is never materialized as Python dicts.
+    ``next_cursor`` is populated once it has been read from the body
+    (at the latest, after iteration finishes).
+
+    Usage:
+        page = StreamedPage(response, TerminalSummary)
+        for terminal in page:
+            ...
+        cursor = page.next_cursor
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        model: Type[T],
+        prefix: str = "items.item",
+    ):
+        """
+        Initialize the streamed page.
+
+        Args:
+            response: Response opened with ``stream=True``
+            model: Model each item is validated into
+            prefix: ijson prefix of the items in the body
+        """
+        self.response = response
+        self.model = model
+        self.prefix = prefix
+        self.next_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator[T]:
+        ijson = _require_ijson()
+        from ijson.common import ObjectBuilder
+
+        # Let urllib3 undo any Content-Encoding before ijson sees the bytes
+        self.response.raw.decode_content = True
+
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(self.response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == self.prefix and event == "end_map":
+                        yield self.model.model_validate(builder.value)
+                        builder = None
+                elif prefix == self.prefix and event == "start_map":
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "next_cursor" and event in ("string", "null"):
+                    self.next_cursor = value
+        finally:
+            self.response.close()
+
+
+def iter_series(
+    response: requests.Response,
+    model: Type[T],
+) -> Iterator[Tuple[str, T]]:
+    """
+    Parse the points of a metrics response one at a time.
+
+    Args:
+        response: Metrics response opened with ``stream=True``
+        model: Model each point is validated into
+
+    Yields:
+        ``(metric name, point)`` pairs, in body order
+    """
+    ijson = _require_ijson()
+    from ijson.common import ObjectBuilder
+
+    response.raw.decode_content = True
+
+    name = ""
+    item_prefix = None
+    builder = None
+    try:
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event == "end_map":
+                    yield name, model.model_validate(builder.value)
+                    builder = None
+            elif prefix == "series" and event == "map_key":
+                # Built from the key itself, so metric names containing dots still match
+                name = value
+                item_prefix = f"series.{name}.item"
+            elif prefix == item_prefix and event == "start_map":
+                builder = ObjectBuilder()
+                builder.event(event, value)
+    finally:
+        response.close()
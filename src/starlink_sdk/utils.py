@@ -1,12 +1,78 @@
 """Utility functions for the Starlink SDK."""
 
+import os
+import re
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from .models import AlertSeverity, AlertStatus, HealthStatus, Interval, TerminalStatus
 
 
+class IdempotencyPool:
+    """
+    Dispenses random UUID4 keys from a pre-generated block of entropy.
+    
+    One ``os.urandom`` call fills ``size`` keys, instead of one call per
+    key as with ``uuid.uuid4()``. Safe to share between threads. A
+    forked child discards the entropy inherited from its parent, so the
+    two processes never hand out the same keys.
+    """
+    
+    __slots__ = ('size', '_buf', '_i', '_pid', '_lock')
+    
+    def __init__(self, size: int = 256, shared: bool = True):
+        """
+        Initialize the pool.
+        
+        Args:
+            size: Number of keys generated per refill
+            shared: Guard the pool with a lock; pass False for a pool only
+                    ever used from one thread
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        
+        self.size = size
+        self._buf = b''
+        self._i = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock() if shared else None
+    
+    def next(self) -> str:
+        """
+        Take the next key from the pool, refilling it when exhausted.
+        
+        Returns:
+            UUID4-formatted key
+        """
+        if self._lock is None:
+            chunk = self._take()
+        else:
+            with self._lock:
+                chunk = self._take()
+        return str(uuid.UUID(bytes=chunk, version=4))
+    
+    def _take(self) -> bytes:
+        """Take the next 16 bytes of entropy, refilling when exhausted or after a fork."""
+        pid = os.getpid()
+        if self._i >= len(self._buf) or pid != self._pid:
+            self._buf = os.urandom(16 * self.size)
+            self._i = 0
+            self._pid = pid
+        chunk = self._buf[self._i:self._i + 16]
+        self._i += 16
+        return chunk
+
+
+# Per-thread key pools, so threads generating keys never wait on each other
+# (each pool refills itself in a forked child)
+_pools = threading.local()
+
+
 def generate_idempotency_key() -> str:
     """
     Generate a unique idempotency key for API requests.
@@ -14,17 +80,33 @@ def generate_idempotency_key() -> str:
     Returns:
         UUID-based idempotency key
     """
-    return str(uuid.uuid4())
+    pool = getattr(_pools, 'pool', None)
+    if pool is None:
+        pool = _pools.pool = IdempotencyPool(shared=False)
+    return pool.next()
+
+
+# (millisecond bucket, datetime) of the last now_utc() call
+_now_cache = (-1, datetime.min.replace(tzinfo=timezone.utc))
 
 
 def now_utc() -> datetime:
     """
     Get current UTC datetime.
     
+    Calls within the same millisecond share one datetime instance, so tight
+    loops building request windows don't construct a new one every time.
+    
     Returns:
         Current UTC datetime
     """
-    return datetime.now(timezone.utc)
+    global _now_cache
+    bucket = time.monotonic_ns() // 1_000_000
+    cached_bucket, value = _now_cache
+    if bucket != cached_bucket:
+        value = datetime.now(timezone.utc)
+        _now_cache = (bucket, value)
+    return value
 
 
 def parse_datetime(dt: Union[str, datetime]) -> datetime:
@@ -55,6 +137,11 @@ def format_datetime(dt: datetime) -> str:
     return dt.isoformat()
 
 
+# 1-64 ASCII letters, digits, hyphens and underscores, with at least one
+# letter or digit
+_TERMINAL_ID_RE = re.compile(r'(?=.*[A-Za-z0-9])[A-Za-z0-9_-]{1,64}')
+
+
 def validate_terminal_id(terminal_id: str) -> bool:
     """
     Validate terminal ID format.
@@ -66,12 +153,7 @@ def validate_terminal_id(terminal_id: str) -> bool:
         True if valid, False otherwise
     """
     # Basic validation - adjust based on actual terminal ID format
-    return (
-        isinstance(terminal_id, str) 
-        and len(terminal_id) > 0 
-        and len(terminal_id) <= 64
-        and terminal_id.replace('-', '').replace('_', '').isalnum()
-    )
+    return isinstance(terminal_id, str) and _TERMINAL_ID_RE.fullmatch(terminal_id) is not None
 
 
 def validate_metrics_list(metrics: List[str]) -> bool:
@@ -108,6 +190,13 @@ def filter_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in data.items() if v is not None}
 
 
+# Plain string value of every API enum member, used when building query params
+_ENUM_STR = {
+    e: e.value
+    for e in (*AlertStatus, *AlertSeverity, *HealthStatus, *TerminalStatus, *Interval)
+}
+
+
 def build_query_params(
     status: Optional[Union[str, TerminalStatus]] = None,
     severity: Optional[Union[str, AlertSeverity]] = None,
@@ -145,19 +234,19 @@ def build_query_params(
     params: Dict[str, str] = {}
     
     if status:
-        params['status'] = status if isinstance(status, str) else status.value
+        params['status'] = _ENUM_STR.get(status, status)
     
     if severity:
-        params['severity'] = severity if isinstance(severity, str) else severity.value
+        params['severity'] = _ENUM_STR.get(severity, severity)
     
     if alert_status:
-        params['status'] = alert_status if isinstance(alert_status, str) else alert_status.value
+        params['status'] = _ENUM_STR.get(alert_status, alert_status)
     
     if health_status:
-        params['health_status'] = health_status if isinstance(health_status, str) else health_status.value
+        params['health_status'] = _ENUM_STR.get(health_status, health_status)
     
     if interval:
-        params['interval'] = interval if isinstance(interval, str) else interval.value
+        params['interval'] = _ENUM_STR.get(interval, interval)
     
     if terminal_id:
         params['terminal_id'] = terminal_id
@@ -188,43 +277,116 @@ def build_query_params(
 class PaginationHelper:
     """Helper class for handling paginated API responses."""
     
-    def __init__(self, client, method_name: str, **base_params):
+    def __init__(self, client, method_name: str, prefetch: bool = False, **base_params):
         """
         Initialize pagination helper.
         
         Args:
             client: Starlink client instance
             method_name: Name of the client method to call
+            prefetch: Fetch the next page in the background as soon as the
+                      current one is returned, overlapping network latency
+                      with processing of the current page
             **base_params: Base parameters for the method
         """
         self.client = client
         self.method_name = method_name
+        self.prefetch = prefetch
         self.base_params = base_params
         self.next_cursor: Optional[str] = None
         self.has_more = True
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._next_future: Optional[Future] = None
+    
+    def _fetch(self, cursor: Optional[str]) -> Any:
+        """Fetch the page starting at ``cursor``."""
+        params = self.base_params.copy()
+        if cursor:
+            params['cursor'] = cursor
+        
+        method = getattr(self.client, self.method_name)
+        return method(**params)
     
-    def get_next_page(self):
+    def get_next_page(self, pages_left: Optional[int] = None):
         """
         Get the next page of results.
         
+        Args:
+            pages_left: Pages the caller will still request after this one
+                        (None for no limit); the following page is not
+                        prefetched when this is 0
+        
         Returns:
             Next page response
         """
-        if not self.has_more:
+        if self._next_future is not None:
+            future, self._next_future = self._next_future, None
+            response = future.result()
+        elif not self.has_more:
             return None
-        
-        params = self.base_params.copy()
-        if self.next_cursor:
-            params['cursor'] = self.next_cursor
-        
-        method = getattr(self.client, self.method_name)
-        response = method(**params)
+        else:
+            response = self._fetch(self.next_cursor)
         
         self.next_cursor = response.next_cursor
         self.has_more = bool(self.next_cursor)
         
+        if self.prefetch and self.has_more and pages_left != 0:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="starlink-prefetch",
+                )
+            self._next_future = self._executor.submit(self._fetch, self.next_cursor)
+        
         return response
     
+    def close(self) -> None:
+        """Discard any prefetched page and stop the background worker."""
+        if self._next_future is not None:
+            self._next_future.cancel()
+            self._next_future = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def __enter__(self) -> "PaginationHelper":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def iter_all_items(self, max_pages: Optional[int] = None) -> Iterator:
+        """
+        Iterate over all items across all pages.
+        
+        Items are yielded page by page, so only the current page is held
+        in memory (with ``prefetch``, the next page loads while the
+        current one is consumed).
+        
+        Args:
+            max_pages: Maximum number of pages to fetch (None for unlimited);
+                       the prefetch worker is shut down when iteration ends
+            
+        Yields:
+            Items from each page in order
+        """
+        page_count = 0
+        
+        try:
+            while self.has_more:
+                if max_pages and page_count >= max_pages:
+                    break
+                
+                pages_left = max_pages - page_count - 1 if max_pages else None
+                response = self.get_next_page(pages_left)
+                if not response:
+                    break
+                page_count += 1
+                yield from response.items
+        finally:
+            # Drop a prefetched page that will not be consumed
+            self.close()
+    
     def get_all_items(self, max_pages: Optional[int] = None):
         """
         Get all items across all pages.
@@ -235,33 +397,25 @@ class PaginationHelper:
         Returns:
             List of all items
         """
-        all_items = []
-        page_count = 0
-        
-        while self.has_more:
-            if max_pages and page_count >= max_pages:
-                break
-            
-            response = self.get_next_page()
-            if response:
-                all_items.extend(response.items)
-                page_count += 1
-            else:
-                break
-        
-        return all_items
+        return list(self.iter_all_items(max_pages))
 
 
-def create_pagination_helper(client, method_name: str, **params) -> PaginationHelper:
+def create_pagination_helper(
+    client,
+    method_name: str,
+    prefetch: bool = False,
+    **params
+) -> PaginationHelper:
     """
     Create a pagination helper for a specific method.
     
     Args:
         client: Starlink client instance
         method_name: Name of the method to paginate
+        prefetch: Fetch each next page in the background while the current one is processed
         **params: Parameters for the method
         
     Returns:
         Configured pagination helper
     """
-    return PaginationHelper(client, method_name, **params)
+    return PaginationHelper(client, method_name, prefetch=prefetch, **params)
@@ -1,19 +1,66 @@
 """Basic tests for the Starlink SDK."""
 
+import os
 import pytest
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from starlink_sdk.models import (
     FleetHealthResponse,
     FleetCounts,
+    MetricsResponse,
     AlertSeverity,
     AlertStatus,
+    AlertUpdateRequest,
     HealthStatus,
+    Interval,
+    Location,
+    MetricPoint,
     TerminalStatus
 )
-from starlink_sdk.exceptions import AuthenticationError, StarlinkAPIError
-from starlink_sdk.utils import generate_idempotency_key, validate_terminal_id
+from starlink_sdk.cache import TTLCache
+from starlink_sdk.client import StarlinkClient, _encode_query, _iso, create_client
+from starlink_sdk.concurrency import AIMDLimiter, BatchExecutor, RateAwareGather
+from starlink_sdk.exceptions import AuthenticationError, RateLimitError, StarlinkAPIError
+from starlink_sdk.ratelimit import TokenBucket, parse_reset
+from starlink_sdk.retry import ATBScheduler, parse_retry_after
+from starlink_sdk.utils import (
+    create_pagination_helper,
+    generate_idempotency_key,
+    now_utc,
+    validate_terminal_id,
+)
+
+
+@contextmanager
+def serve_status(status, headers=None):
+    """Serve ``status`` to every request on a local port, counting the hits."""
+    hits = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", hits
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 class TestModels:
@@ -33,6 +80,52 @@ class TestModels:
         assert response.counts.degraded == 2
         assert response.counts.offline == 1
     
+    def test_metrics_to_arrays(self):
+        """Test converting metric series to NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        response = MetricsResponse(
+            terminal_id="T1",
+            from_time="2024-01-01T00:00:00Z",
+            to_time="2024-01-01T00:10:00Z",
+            interval="5m",
+            series={"latency_ms": [
+                {"t": "2024-01-01T00:00:00Z", "v": 10.0},
+                {"t": "2024-01-01T00:05:00Z", "v": 20.0},
+            ]},
+        )
+        
+        series = response.to_arrays()["latency_ms"]
+        assert series.v.mean() == 15.0
+        assert series.ts[-1] == np.datetime64("2024-01-01T00:05:00")
+        assert series.points() == response.series["latency_ms"]
+    
+    def test_telemetry_request_to_bytes(self):
+        """Test that the fast serializer matches pydantic's JSON output."""
+        import json
+        from starlink_sdk.models import TelemetryIngestRequest
+        
+        request = TelemetryIngestRequest(
+            terminal_id="T1",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            metrics={"latency_ms": 42.5, "uptime_seconds": 86400}
+        )
+        
+        assert json.loads(request.to_bytes()) == json.loads(request.model_dump_json())
+    
+    def test_telemetry_request_to_bytes_falls_back(self):
+        """Test that values the fast serializer can't encode still serialize."""
+        import json
+        from decimal import Decimal
+        from starlink_sdk.models import TelemetryIngestRequest
+        
+        request = TelemetryIngestRequest(
+            terminal_id="T1",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            metrics={"latency_ms": Decimal("42.5"), "location": Location(lat=1.5, lon=2.5)}
+        )
+        
+        assert json.loads(request.to_bytes()) == json.loads(request.model_dump_json())
+    
     def test_enum_values(self):
         """Test enum value validation."""
         assert AlertSeverity.CRITICAL == "critical"
@@ -52,6 +145,71 @@ class TestUtils:
         assert key1 != key2
         assert len(key1) == 36  # UUID4 length with hyphens
     
+    def test_idempotency_pool_refills(self):
+        """Test that the key pool keeps producing unique UUID4 keys across refills."""
+        import uuid
+        from starlink_sdk.utils import IdempotencyPool
+        
+        pool = IdempotencyPool(size=2)
+        keys = [pool.next() for _ in range(5)]
+        
+        assert len(set(keys)) == 5
+        assert all(uuid.UUID(key).version == 4 for key in keys)
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_idempotency_pool_not_shared_after_fork(self):
+        """Test that a forked child does not reuse the parent's pre-generated keys."""
+        from starlink_sdk.utils import IdempotencyPool
+        
+        pool = IdempotencyPool()
+        pool.next()
+        child_key = self._key_from_child(pool.next)
+        
+        assert child_key
+        assert child_key != pool.next()
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_generated_keys_not_shared_after_fork(self):
+        """Test that the per-thread default pool is also reset in a forked child."""
+        generate_idempotency_key()
+        child_key = self._key_from_child(generate_idempotency_key)
+        
+        assert child_key
+        assert child_key != generate_idempotency_key()
+    
+    @staticmethod
+    def _key_from_child(make_key):
+        """Fork, generate one key in the child and return it to the parent."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, make_key().encode())
+            os._exit(0)
+        
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as pipe:
+            return pipe.read()
+    
+    def test_idempotency_keys_unique_across_threads(self):
+        """Test that per-thread key pools never hand out the same key."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            batches = list(pool.map(lambda _: [generate_idempotency_key() for _ in range(300)], range(4)))
+        
+        keys = [key for batch in batches for key in batch]
+        assert len(set(keys)) == len(keys)
+    
+    def test_now_utc(self):
+        """Test that the cached clock returns current, timezone-aware UTC times."""
+        before = datetime.now(timezone.utc)
+        now = now_utc()
+        
+        assert now.tzinfo is timezone.utc
+        assert abs((now - before).total_seconds()) < 0.01
+    
     def test_validate_terminal_id(self):
         """Test terminal ID validation."""
         assert validate_terminal_id("TERMINAL_123") is True
@@ -59,6 +217,117 @@ class TestUtils:
         assert validate_terminal_id("term_789") is True
         assert validate_terminal_id("") is False
         assert validate_terminal_id("term with spaces") is False
+        assert validate_terminal_id("T" * 65) is False
+        assert validate_terminal_id("term\n") is False
+        assert validate_terminal_id("-") is False
+        assert validate_terminal_id("___") is False
+        assert validate_terminal_id("-_-") is False
+    
+    def test_build_query_params_plain_strings(self):
+        """Test that enum filters become plain string values."""
+        from starlink_sdk.utils import build_query_params
+        
+        params = build_query_params(status=TerminalStatus.ONLINE, severity="critical", interval=Interval.FIVE_MINUTES)
+        
+        assert params == {"status": "online", "severity": "critical", "interval": "5m"}
+        assert type(params["status"]) is str
+
+
+class TestPagination:
+    """Test the pagination helper."""
+    
+    @staticmethod
+    def _pages():
+        pages = {
+            None: MagicMock(items=[1, 2], next_cursor="c1"),
+            "c1": MagicMock(items=[3], next_cursor="c2"),
+            "c2": MagicMock(items=[4], next_cursor=None),
+        }
+        api = MagicMock()
+        api.list.side_effect = lambda limit, cursor=None: pages[cursor]
+        return api
+    
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_get_all_items(self, prefetch):
+        """Test walking every page with and without prefetching."""
+        paginator = create_pagination_helper(self._pages(), "list", prefetch=prefetch, limit=2)
+        
+        assert paginator.get_all_items() == [1, 2, 3, 4]
+        assert paginator.has_more is False
+        paginator.close()
+    
+    def test_iter_all_items_is_lazy(self):
+        """Test that items are yielded before later pages are requested."""
+        api = self._pages()
+        items = create_pagination_helper(api, "list", limit=2).iter_all_items()
+        
+        assert next(items) == 1
+        assert api.list.call_count == 1
+        assert list(items) == [2, 3, 4]
+    
+    def test_prefetch_worker_released(self):
+        """Test that the prefetch worker is shut down after a bounded walk."""
+        api = self._pages()
+        with create_pagination_helper(api, "list", prefetch=True, limit=2) as paginator:
+            assert paginator.get_all_items(max_pages=1) == [1, 2]
+            assert paginator._executor is None
+            assert paginator.has_more is True
+        
+        # No page beyond the limit is prefetched
+        assert api.list.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_async_get_all_items(self):
+        """Test walking every page of an async list method with prefetching."""
+        from starlink_sdk import AsyncPaginationHelper
+        
+        pages = self._pages()
+        api = MagicMock()
+        api.list = AsyncMock(side_effect=pages.list.side_effect)
+        paginator = AsyncPaginationHelper(api, "list", limit=2)
+        
+        assert await paginator.get_all_items() == [1, 2, 3, 4]
+        assert api.list.await_count == 3
+        
+        # No page beyond the limit is prefetched while items are consumed
+        import asyncio
+        api.list.reset_mock()
+        items = []
+        async for item in AsyncPaginationHelper(api, "list", limit=2).iter_all_items(max_pages=2):
+            items.append(item)
+            await asyncio.sleep(0)
+        assert items == [1, 2, 3]
+        assert api.list.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_async_aclose_waits_for_prefetch(self):
+        """Test that aclose cancels the prefetch and waits for it to finish."""
+        import asyncio
+        from starlink_sdk import AsyncPaginationHelper
+        
+        cancelled = []
+        first = MagicMock(items=[1], next_cursor="c1")
+        
+        async def list_page(**params):
+            if "cursor" not in params:
+                return first
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(params["cursor"])
+                raise
+        
+        api = MagicMock()
+        api.list = list_page
+        paginator = AsyncPaginationHelper(api, "list", limit=1)
+        
+        assert await paginator.get_next_page() is first
+        task = paginator._next_task
+        await asyncio.sleep(0)
+        await paginator.aclose()
+        
+        assert task.done()
+        assert cancelled == ["c1"]
 
 
 class TestExceptions:
@@ -86,6 +355,769 @@ class TestExceptions:
         assert str(error) == "Invalid credentials"
 
 
+class TestConcurrency:
+    """Test rate limiting and batch helpers."""
+    
+    def test_token_bucket_burst_then_empty(self):
+        """Test that the bucket admits a burst and then refuses."""
+        bucket = TokenBucket(rpm=60, burst=2)
+        
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+    
+    def test_token_bucket_pauses_on_low_remaining(self):
+        """Test that the bucket pauses when the server reports the quota nearly spent."""
+        bucket = TokenBucket(rpm=600, burst=5)
+        bucket.update_from_headers({
+            "x-ratelimit-remaining-requests": "1",
+            "x-ratelimit-reset-requests": "30s",
+        })
+        
+        assert bucket.try_acquire() is False
+    
+    def test_parse_reset_formats(self):
+        """Test reset header parsing for seconds and duration strings."""
+        assert parse_reset("12") == 12.0
+        assert parse_reset("1m30s") == 90.0
+        assert parse_reset("250ms") == 0.25
+        assert parse_reset("later") is None
+    
+    def test_token_bucket_rejects_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rpm=0)
+    
+    def test_aimd_limiter_adjusts_concurrency(self):
+        """Test additive increase on fast calls and halving on 429."""
+        limiter = AIMDLimiter(target_latency=1.0, alpha=1.0, beta=0.5, c_max=8, initial=4)
+        
+        limiter.on_result(0.1, 200)
+        assert limiter.current == 5
+        
+        limiter.on_result(0.1, 429)
+        assert limiter.current == 2
+        
+        limiter.on_result(0.1, None)
+        assert limiter.current == 1
+    
+    def test_batch_executor_non_http_errors_shrink_limiter(self):
+        """Test that errors without an HTTP status count as failures, not successes."""
+        limiter = AIMDLimiter(target_latency=1.0, beta=0.5, c_max=8, initial=4)
+        
+        def work(x):
+            raise ValueError("bad payload")
+        
+        with BatchExecutor(limiter=limiter) as executor:
+            results = executor.map(work, [1])
+        
+        assert isinstance(results[0], ValueError)
+        assert limiter.current == 2
+    
+    def test_atb_scheduler_widens_with_congestion(self):
+        """Test that retry delays honour Retry-After and grow with congestion."""
+        scheduler = ATBScheduler(window=10, base_delay=1.0, max_delay=100.0)
+        assert scheduler.congestion == 0.0
+        assert 0.0 <= scheduler.next_delay(0) <= 1.0
+        assert scheduler.next_delay(0, retry_after=5.0) >= 5.0
+        
+        for _ in range(5):
+            scheduler.record(True)
+            scheduler.record(False)
+        assert scheduler.congestion == 0.5
+        assert all(scheduler.next_delay(0) <= 2.0 for _ in range(20))
+    
+    def test_atb_scheduler_records_every_throttled_attempt(self):
+        """Test that the scheduler sees each 429 sent on the wire, not one per chain."""
+        scheduler = ATBScheduler(base_delay=0.0)
+        client = StarlinkClient(
+            environment="local", api_secret="secret", max_retries=3,
+            retry_scheduler=scheduler, cache_ttl=None,
+        )
+        
+        with serve_status(429, {"Retry-After": "0"}) as (base_url, hits), \
+                patch.object(client.token_manager, "get_auth_header", return_value={}), \
+                pytest.raises(RateLimitError):
+            client.base_url = base_url
+            client.health_check()
+        
+        assert scheduler.snapshot() == (len(hits), len(hits))
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds and malformed values."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+    
+    def test_batch_executor_map_preserves_order(self):
+        """Test that map returns results in input order with exceptions inline."""
+        def work(x):
+            if x == 2:
+                raise RuntimeError("boom")
+            return x * 10
+        
+        with BatchExecutor(max_workers=3) as executor:
+            results = executor.map(work, [1, 2, 3])
+        
+        assert results[0] == 10
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 30
+    
+    def test_rate_aware_gather_pauses_after_429(self):
+        """Test that a rate limit holds back calls that have not started."""
+        import time
+        started = {}
+        
+        def throttled():
+            started["throttled"] = time.monotonic()
+            raise RateLimitError(retry_after=0.05)
+        
+        def later():
+            started["later"] = time.monotonic()
+            return "ok"
+        
+        with RateAwareGather(max_workers=1) as gather:
+            results = dict(gather.as_completed({"throttled": throttled, "later": later}))
+        
+        with pytest.raises(RateLimitError):
+            results["throttled"].result()
+        assert results["later"].result() == "ok"
+        assert started["later"] - started["throttled"] >= 0.05
+
+
+class TestCaching:
+    """Test the response cache."""
+    
+    def test_ttl_cache_expiry_and_eviction(self):
+        """Test that entries expire and the oldest entry is evicted."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+        
+        cache.set("d", 4, ttl=0)
+        assert cache.get("d") is None
+    
+    def test_health_check_is_cached_and_invalidated(self):
+        """Test that repeated health checks reuse the cached response."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.content = b'{"status": "ok"}'
+        client._make_request = MagicMock(return_value=response)
+        
+        assert client.health_check() == {"status": "ok"}
+        assert client.health_check() == {"status": "ok"}
+        assert client._make_request.call_count == 1
+        
+        client.invalidate_cache()
+        client.health_check()
+        assert client._make_request.call_count == 2
+    
+    def test_health_check_respects_shorter_cache_ttl(self):
+        """Test that a client's cache_ttl caps the health check's own ttl."""
+        client = StarlinkClient(environment="local", api_secret="secret", cache_ttl=5)
+        response = MagicMock()
+        response.content = b'{"status": "ok"}'
+        client._make_request = MagicMock(return_value=response)
+        
+        with patch.object(client._cache, "set", wraps=client._cache.set) as cache_set:
+            client.health_check()
+        
+        assert cache_set.call_args.kwargs["ttl"] == 5
+
+
+class TestClient:
+    """Test client construction."""
+    
+    def test_create_client_reuses_instance(self):
+        """Test that create_client hands out one client per configuration."""
+        first = create_client(environment="local", api_secret="secret", timeout=5.0)
+        second = create_client(environment="local", api_secret="secret", timeout=5.0)
+        other = create_client(environment="local", api_secret="secret", timeout=6.0)
+        
+        assert first is second
+        assert first is not other
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_create_client_not_shared_after_fork(self):
+        """Test that a forked child gets its own client instead of the parent's."""
+        parent = create_client(environment="local", api_secret="secret", timeout=7.0)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            child = create_client(environment="local", api_secret="secret", timeout=7.0)
+            os.write(write_fd, b"fresh" if child is not parent else b"shared")
+            os._exit(0)
+        
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as pipe:
+            assert pipe.read() == "fresh"
+        assert create_client(environment="local", api_secret="secret", timeout=7.0) is parent
+    
+    def test_injected_session_errors_do_not_claim_retries(self):
+        """Test that failures on a caller's session are not reported as retried."""
+        import requests
+        from starlink_sdk.exceptions import StarlinkClientError
+        
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError("refused")
+        client = StarlinkClient(environment="local", api_secret="secret", session=session, cache_ttl=None)
+        
+        with patch.object(client.token_manager, "get_auth_header", return_value={}), \
+                pytest.raises(StarlinkClientError) as exc_info:
+            client.health_check()
+        
+        assert "retries" not in str(exc_info.value)
+    
+    def test_list_terminals_field_projection(self):
+        """Test that a field projection is forwarded and parses into partial models."""
+        client = StarlinkClient(environment="local", api_secret="secret", cache_ttl=None)
+        response = MagicMock()
+        response.content = b'{"items": [{"terminal_id": "T1", "status": "online"}]}'
+        
+        with patch.object(client.terminals, "_req", return_value=response) as request:
+            page = client.terminals.list(limit=50, fields=["status"])
+        
+        assert request.call_args.kwargs["params"]["fields"] == "terminal_id,status"
+        assert page.items[0].status == TerminalStatus.ONLINE
+        assert page.items[0].last_seen is None
+    
+    def test_stream_health_decodes_events(self):
+        """Test that server-sent health events are decoded as they arrive."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.iter_lines.return_value = [b'event: health', b'data: {"status": "ok"}', b'']
+        
+        with patch.object(client, "_make_request", return_value=response):
+            assert list(client.stream_health()) == [{"status": "ok"}]
+        response.close.assert_called_once()
+    
+    def test_stream_health_falls_back_on_404(self):
+        """Test that servers without the stream endpoint get a plain health check."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        
+        with patch.object(client, "_make_request", side_effect=StarlinkAPIError("missing", status_code=404)), \
+                patch.object(StarlinkClient, "health_check", return_value={"status": "ok"}):
+            assert list(client.stream_health()) == [{"status": "ok"}]
+    
+    def test_token_manager_shares_client_session(self):
+        """Test that token refreshes go through the client's pooled session."""
+        session = MagicMock()
+        client = StarlinkClient(environment="local", api_secret="secret", session=session)
+        
+        assert client.token_manager.session is session
+    
+    def test_transport_retries_configured(self):
+        """Test that the owned session retries transient statuses in the adapter."""
+        client = StarlinkClient(
+            environment="local", api_secret="secret", max_retries=2, backoff_factor=0.5
+        )
+        retry = client._session.get_adapter("https://example.com").max_retries
+        
+        assert retry.total == 2
+        assert retry.backoff_factor == 0.5
+        assert {429, 503} <= set(retry.status_forcelist)
+    
+    @pytest.mark.parametrize("scheduler", [None, ATBScheduler(base_delay=0.0)])
+    def test_throttled_requests_not_retried_twice(self, scheduler):
+        """Test that 429s with Retry-After are retried by one layer only."""
+        client = StarlinkClient(
+            environment="local", api_secret="secret", max_retries=3,
+            backoff_factor=0.0, retry_scheduler=scheduler, cache_ttl=None,
+        )
+        
+        with serve_status(429, {"Retry-After": "0"}) as (base_url, hits), \
+                patch.object(client.token_manager, "get_auth_header", return_value={}), \
+                pytest.raises(RateLimitError):
+            client.base_url = base_url
+            client.health_check()
+        
+        assert len(hits) == 4
+    
+    def test_rate_limited_retries_pass_the_bucket(self):
+        """Test that with a rate limit, each retried attempt is admitted by the bucket."""
+        client = StarlinkClient(
+            environment="local", api_secret="secret", max_retries=3,
+            backoff_factor=0.0, rate_limit_rpm=6000, cache_ttl=None,
+        )
+        
+        with serve_status(503) as (base_url, hits), \
+                patch.object(client.token_manager, "get_auth_header", return_value={}), \
+                patch.object(client._bucket, "acquire") as acquire, \
+                pytest.raises(StarlinkAPIError):
+            client.base_url = base_url
+            client.health_check()
+        
+        assert len(hits) == 4
+        assert acquire.call_count == 4
+    
+    def test_query_string_encoded_once(self):
+        """Test that query parameters are encoded into the URL with enum values."""
+        session = MagicMock()
+        session.request.return_value.ok = True
+        session.request.return_value.content = b'{"items": []}'
+        client = StarlinkClient(environment="local", api_secret="secret", session=session)
+        
+        with patch.object(client.token_manager, "get_auth_header", return_value={}):
+            client.alerts.list(status=AlertStatus.OPEN, limit=50)
+        
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["url"] == "http://localhost:8000/v1/alerts?limit=50&status=open"
+        assert client._query_cache[("/v1/alerts", (("limit", 50), ("status", "open")))] == kwargs["url"]
+        assert "params" not in kwargs
+        assert client._url_cache["/v1/alerts"] == "http://localhost:8000/v1/alerts"
+        assert kwargs["headers"]["Accept"] == "application/json"
+        assert kwargs["headers"]["User-Agent"].startswith("starlink-sdk/")
+        assert "gzip" in kwargs["headers"]["Accept-Encoding"]
+    
+    def test_iso_cache_keeps_utc_offset(self):
+        """Test that equal instants in different zones keep their own formatting."""
+        from datetime import timedelta
+        
+        utc = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        plus_one = datetime(2024, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1)))
+        
+        assert _iso(utc) == "2024-01-01T12:00:00+00:00"
+        assert _iso(plus_one) == "2024-01-01T13:00:00+01:00"
+    
+    def test_str_enums_encode_as_values(self):
+        """Test that str-based enums are sent by value without conversion."""
+        query = _encode_query({
+            "status": AlertStatus.OPEN,
+            "severity": AlertSeverity.CRITICAL,
+            "cursor": None,
+        })
+        
+        assert query == "status=open&severity=critical"
+    
+    def test_large_telemetry_body_is_gzipped(self):
+        """Test that telemetry bodies above the threshold are sent gzip-encoded."""
+        import gzip
+        from starlink_sdk.models import TelemetryIngestRequest
+        
+        client = StarlinkClient(environment="local", api_secret="secret", cache_ttl=None)
+        response = MagicMock()
+        response.content = b'{"accepted": true, "request_id": "r1"}'
+        request = TelemetryIngestRequest(
+            terminal_id="T1",
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            metrics={f"metric_{i}": float(i) for i in range(100)}
+        )
+        
+        with patch.object(client.telemetry, "_req", return_value=response) as send:
+            client.telemetry.ingest(request, idempotency_key="key")
+        
+        kwargs = send.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert gzip.decompress(kwargs["data"]) == request.to_bytes()
+    
+    def test_metrics_params_are_normalized(self):
+        """Test that times are sent to the second and intervals by value."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.content = (
+            b'{"terminal_id": "T1", "from_time": "2024-01-01T00:00:00Z",'
+            b' "to_time": "2024-01-01T01:00:00Z", "interval": "5m", "series": {}}'
+        )
+        
+        with patch.object(client.terminals, "_req", return_value=response) as request:
+            client.terminals.get_metrics(
+                "T1",
+                from_time=datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc),
+                to_time=datetime(2024, 1, 1, 1, 0, 0, tzinfo=timezone.utc),
+                interval=Interval.FIVE_MINUTES,
+            )
+        
+        params = request.call_args.kwargs["params"]
+        assert params["from"] == "2024-01-01T00:00:00+00:00"
+        assert params["interval"] == "5m"
+    
+    def test_metric_series_reads_naive_times_as_utc(self):
+        """Test that naive timestamps are not shifted by the host's UTC offset."""
+        np = pytest.importorskip("numpy")
+        from starlink_sdk.models import MetricSeries
+        
+        expected = np.array(["2024-01-01T00:00:00"], dtype="datetime64[us]")
+        from_points = MetricSeries.from_points([MetricPoint(t=datetime(2024, 1, 1), v=1.0)])
+        from_json = MetricSeries.from_json([{"t": "2024-01-01T00:00:00", "v": 1.0}])
+        
+        assert np.array_equal(from_points.ts, expected)
+        assert np.array_equal(from_json.ts, expected)
+    
+    def test_metric_series_parses_any_fraction_length(self):
+        """Test that from_json accepts every timestamp MetricPoint accepts."""
+        np = pytest.importorskip("numpy")
+        from starlink_sdk.models import MetricSeries
+        
+        raw = [{"t": "2024-01-01T00:00:00.25Z", "v": 1.0}, {"t": "2024-01-01T00:00:01.1234Z", "v": 2.0}]
+        series = MetricSeries.from_json(raw)
+        expected = MetricSeries.from_points([MetricPoint.model_validate(p) for p in raw])
+        
+        assert np.array_equal(series.ts, expected.ts)
+    
+    def test_metrics_arrays_match_validated_series(self):
+        """Test that get_metrics_arrays builds the same arrays as to_arrays."""
+        np = pytest.importorskip("numpy")
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.content = (
+            b'{"terminal_id": "T1", "from_time": "2024-01-01T00:00:00Z",'
+            b' "to_time": "2024-01-01T01:00:00Z", "interval": "5m",'
+            b' "series": {"latency_ms": [{"t": "2024-01-01T00:00:00Z", "v": 42.5},'
+            b' {"t": "2024-01-01T00:05:00.250000+00:00", "v": 40}]}}'
+        )
+        expected = MetricsResponse.model_validate_json(response.content).to_arrays()
+        
+        with patch.object(client.terminals, "_req", return_value=response):
+            arrays = client.terminals.get_metrics_arrays("T1", from_time=now_utc(), to_time=now_utc())
+        
+        series = arrays["latency_ms"]
+        assert np.array_equal(series.ts, expected["latency_ms"].ts)
+        assert np.array_equal(series.v, expected["latency_ms"].v)
+    
+    def test_metrics_without_validation(self):
+        """Test that validate=False constructs models from the decoded body as is."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.content = (
+            b'{"terminal_id": "T1", "from_time": "2024-01-01T00:00:00Z",'
+            b' "to_time": "2024-01-01T01:00:00Z", "interval": "5m",'
+            b' "series": {"latency_ms": [{"t": "2024-01-01T00:00:00Z", "v": 42.5}]}}'
+        )
+        
+        with patch.object(client.terminals, "_req", return_value=response):
+            metrics = client.terminals.get_metrics(
+                "T1", from_time=now_utc(), to_time=now_utc(), validate=False
+            )
+        
+        point = metrics.series["latency_ms"][0]
+        assert isinstance(point, MetricPoint)
+        assert point.t == "2024-01-01T00:00:00Z"
+        assert point.v == 42.5
+    
+    @pytest.mark.parametrize("update", [
+        "acknowledged",
+        {"status": "acknowledged"},
+        AlertUpdateRequest(status=AlertStatus.ACKNOWLEDGED),
+    ])
+    def test_alert_update_accepts_request_forms(self, update):
+        """Test that alert updates accept a status, a dict, or a request model."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        response = MagicMock()
+        response.content = (
+            b'{"alert_id": "A1", "terminal_id": "T1", "severity": "warn", "type": "latency",'
+            b' "message": "High latency", "created_at": "2024-01-01T00:00:00Z",'
+            b' "status": "acknowledged", "updated_at": "2024-01-01T00:00:00Z"}'
+        )
+        
+        with patch.object(client.alerts, "_req", return_value=response) as request:
+            client.alerts.update("A1", update)
+        
+        assert request.call_args.kwargs["data"] == b'{"status":"acknowledged"}'
+    
+    def test_namespaces_bind_request_method(self):
+        """Test that API namespaces are slotted and reuse the client's bound request method."""
+        client = StarlinkClient(environment="local", api_secret="secret")
+        
+        for namespace in (client.fleet, client.terminals, client.alerts, client.telemetry):
+            assert not hasattr(namespace, "__dict__")
+            assert namespace._req == client._make_request
+    
+    def test_persistent_401_refreshes_once_then_raises(self):
+        """Test that a rejected token is refreshed once before giving up."""
+        session = MagicMock()
+        session.post.return_value.content = b'{"access_token": "tok", "expires_in": 3600}'
+        session.request.return_value.ok = False
+        session.request.return_value.status_code = 401
+        client = StarlinkClient(environment="local", api_secret="secret", session=session)
+        
+        with pytest.raises(AuthenticationError):
+            client.fleet.get_health(from_time=datetime.now(), to_time=datetime.now())
+        
+        assert session.post.call_count == 2
+        assert session.request.call_count == 2
+    
+    def test_rejected_stream_closed_before_retry(self):
+        """Test that a streamed 401 response releases its connection before the retry."""
+        session = MagicMock()
+        session.post.return_value.content = b'{"access_token": "tok", "expires_in": 3600}'
+        rejected, accepted = MagicMock(ok=False, status_code=401), MagicMock(ok=True)
+        session.request.side_effect = [rejected, accepted]
+        client = StarlinkClient(environment="local", api_secret="secret", session=session)
+        
+        assert client._make_request("GET", "/v1/terminals", stream=True) is accepted
+        rejected.close.assert_called_once()
+        accepted.close.assert_not_called()
+    
+    def test_401_retried_even_without_retries(self):
+        """Test that the one-shot token refresh does not depend on max_retries."""
+        session = MagicMock()
+        session.post.return_value.content = b'{"access_token": "tok", "expires_in": 3600}'
+        rejected, accepted = MagicMock(ok=False, status_code=401), MagicMock(ok=True)
+        accepted.content = b'{"status": "ok"}'
+        session.request.side_effect = [rejected, accepted]
+        client = StarlinkClient(
+            environment="local", api_secret="secret", session=session, max_retries=0, cache_ttl=None
+        )
+        
+        assert client.health_check() == {"status": "ok"}
+        assert session.post.call_count == 2
+    
+    def test_error_detail_decoded_from_body(self):
+        """Test that JSON error bodies become the exception detail."""
+        session = MagicMock()
+        error_response = session.request.return_value
+        error_response.ok = False
+        error_response.status_code = 404
+        error_response.content = b'{"detail": "terminal not found"}'
+        client = StarlinkClient(environment="local", api_secret="secret", session=session)
+        
+        with patch.object(client.token_manager, "get_auth_header", return_value={}):
+            with pytest.raises(StarlinkAPIError) as exc_info:
+                client.terminals.get("T1")
+        
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == {"detail": "terminal not found"}
+    
+    def test_connection_pool_configuration(self):
+        """Test that pool settings are applied to the owned session's adapter."""
+        client = StarlinkClient(
+            environment="local", api_secret="secret", pool_maxsize=32, pool_block=False
+        )
+        adapter = client._session.get_adapter("https://example.com")
+        
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is False
+    
+    def test_injected_session_is_not_closed(self):
+        """Test that the client leaves caller-provided sessions open."""
+        session = MagicMock()
+        with StarlinkClient(environment="local", api_secret="secret", session=session):
+            pass
+        session.close.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_async_client_requests(self):
+        """Test that the async client sends authenticated requests and maps errors."""
+        httpx = pytest.importorskip("httpx")
+        from starlink_sdk import AsyncStarlinkClient
+        
+        def handler(request):
+            assert request.headers["Authorization"] == "Bearer token"
+            if request.url.path == "/v1/terminals/T1":
+                return httpx.Response(200, json={"terminal_id": "T1"})
+            return httpx.Response(404, json={"detail": "not found"})
+        
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http:
+            client = AsyncStarlinkClient(environment="local", api_secret="secret", client=http)
+            with patch.object(client.token_manager, "get_auth_header",
+                              return_value={"Authorization": "Bearer token"}):
+                terminal = await client.terminals.get("T1")
+                with pytest.raises(StarlinkAPIError) as exc_info:
+                    await client.terminals.get("T2")
+        
+        assert terminal.terminal_id == "T1"
+        assert exc_info.value.status_code == 404
+    
+    @pytest.mark.asyncio
+    async def test_async_concurrent_401s_refresh_once(self):
+        """Test that coroutines rejected with the same token share one refresh."""
+        import asyncio
+        
+        httpx = pytest.importorskip("httpx")
+        from starlink_sdk import AsyncStarlinkClient
+        from starlink_sdk.auth import TokenManager
+        
+        tokens = iter([b"stale", b"fresh"])
+        session = MagicMock()
+        session.post.side_effect = lambda *a, **kw: MagicMock(
+            status_code=200,
+            content=b'{"access_token": "%s", "expires_in": 3600}' % next(tokens),
+        )
+        
+        def handler(request):
+            if request.headers["Authorization"] == "Bearer stale":
+                return httpx.Response(401, json={"detail": "expired"})
+            return httpx.Response(200, json={"status": "ok"})
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = AsyncStarlinkClient(environment="local", api_secret="secret", client=http)
+            client.token_manager = TokenManager("http://localhost:8000", api_secret="secret", session=session)
+            results = await asyncio.gather(*[client.health_check() for _ in range(5)])
+        
+        assert results == [{"status": "ok"}] * 5
+        assert session.post.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_async_injected_client_errors_do_not_claim_retries(self):
+        """Test that failures on a caller's httpx client are not reported as retried."""
+        httpx = pytest.importorskip("httpx")
+        from starlink_sdk import AsyncStarlinkClient
+        from starlink_sdk.exceptions import StarlinkClientError
+        
+        def handler(request):
+            raise httpx.ConnectError("refused")
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = AsyncStarlinkClient(environment="local", api_secret="secret", client=http)
+            with patch.object(client.token_manager, "get_auth_header", return_value={}), \
+                    pytest.raises(StarlinkClientError) as exc_info:
+                await client.health_check()
+        
+        assert "retries" not in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    async def test_async_ingest_many(self):
+        """Test that a telemetry batch is sent concurrently with one key per request."""
+        httpx = pytest.importorskip("httpx")
+        from starlink_sdk import AsyncStarlinkClient
+        from starlink_sdk.models import TelemetryIngestRequest
+        
+        keys = []
+        
+        def handler(request):
+            keys.append(request.headers["Idempotency-Key"])
+            return httpx.Response(200, json={"accepted": True, "request_id": request.headers["Idempotency-Key"]})
+        
+        batch = [
+            (TelemetryIngestRequest(terminal_id="T1", timestamp=now_utc(), metrics={"latency_ms": i}), f"key-{i}")
+            for i in range(3)
+        ]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = AsyncStarlinkClient(environment="local", api_secret="secret", client=http)
+            with patch.object(client.token_manager, "get_auth_header", return_value={}):
+                responses = await client.telemetry.ingest_many(batch)
+        
+        assert [r.request_id for r in responses] == ["key-0", "key-1", "key-2"]
+        assert sorted(keys) == ["key-0", "key-1", "key-2"]
+
+
+class TestAuth:
+    """Test token management."""
+    
+    def _token_manager(self, expires_in=3600):
+        from starlink_sdk.auth import TokenManager
+        
+        session = MagicMock()
+        session.post.return_value.content = (
+            b'{"access_token": "tok", "expires_in": %d}' % expires_in
+        )
+        return TokenManager("http://localhost:8000", api_secret="secret", session=session)
+    
+    def test_auth_header_is_cached_until_refresh(self):
+        """Test that the auth header dict is reused while the token is valid."""
+        manager = self._token_manager()
+        
+        header = manager.get_auth_header()
+        
+        assert header == {"Authorization": "Bearer tok"}
+        assert manager.get_auth_header() is header
+        manager.session.post.assert_called_once()
+    
+    def test_invalidate_ignores_already_replaced_token(self):
+        """Test that only the rejected token is invalidated."""
+        manager = self._token_manager()
+        rejected = manager.get_auth_header()
+        
+        manager.invalidate(rejected)
+        current = manager.get_auth_header()
+        manager.invalidate(rejected)
+        
+        assert manager.get_auth_header() is current
+        assert manager.session.post.call_count == 2
+    
+    def test_token_refreshed_in_background_before_expiry(self):
+        """Test that a token due for rotation is refreshed without blocking callers."""
+        import time
+        manager = self._token_manager()
+        manager.get_token()
+        
+        # Pretend the token is past its refresh point but not yet expired
+        manager._refresh_at = time.time() - 1
+        manager.session.post.return_value.content = (
+            b'{"access_token": "tok2", "expires_in": 3600}'
+        )
+        
+        assert manager.get_token() == "tok"
+        manager._refresh_thread.join(timeout=1)
+        assert manager.get_token() == "tok2"
+        assert manager.session.post.call_count == 2
+
+
+class TestStreaming:
+    """Test incremental parsing of list responses."""
+    
+    def test_streamed_page_yields_items_and_cursor(self):
+        """Test that items are validated one by one and the cursor is captured."""
+        pytest.importorskip("ijson")
+        from io import BytesIO
+        from starlink_sdk.models import TerminalSummary
+        from starlink_sdk.streaming import StreamedPage
+        
+        body = (
+            b'{"items": ['
+            b'{"terminal_id": "T1", "status": "online", "health_status": "healthy", "last_seen": "2024-01-01T00:00:00Z"},'
+            b'{"terminal_id": "T2", "status": "offline", "health_status": "healthy", "last_seen": "2024-01-01T00:00:00Z"}'
+            b'], "next_cursor": "abc"}'
+        )
+        response = MagicMock()
+        response.raw = BytesIO(body)
+        
+        page = StreamedPage(response, TerminalSummary)
+        ids = [terminal.terminal_id for terminal in page]
+        
+        assert ids == ["T1", "T2"]
+        assert page.next_cursor == "abc"
+        response.close.assert_called_once()
+    
+    def test_alerts_iter_list_follows_cursors(self):
+        """Test that streamed alert pages are followed until the last one."""
+        pytest.importorskip("ijson")
+        from io import BytesIO
+        
+        alert = (
+            b'{"alert_id": "%s", "terminal_id": "T1", "severity": "critical", "type": "outage",'
+            b' "message": "down", "created_at": "2024-01-01T00:00:00Z", "status": "open"}'
+        )
+        first, last = MagicMock(), MagicMock()
+        first.raw = BytesIO(b'{"items": [' + alert % b"A1" + b'], "next_cursor": "c1"}')
+        last.raw = BytesIO(b'{"items": [' + alert % b"A2" + b'], "next_cursor": null}')
+        client = StarlinkClient(environment="local", api_secret="secret")
+        
+        with patch.object(client.alerts, "_req", side_effect=[first, last]) as request:
+            ids = [a.alert_id for a in client.alerts.iter_list(severity=AlertSeverity.CRITICAL)]
+        
+        assert ids == ["A1", "A2"]
+        assert request.call_args.kwargs["params"]["cursor"] == "c1"
+    
+    def test_iter_metrics_yields_named_points(self):
+        """Test that metric points are streamed with their series name."""
+        pytest.importorskip("ijson")
+        from io import BytesIO
+        
+        response = MagicMock()
+        response.raw = BytesIO(
+            b'{"terminal_id": "T1", "interval": "5m", "series": {'
+            b'"latency_ms": [{"t": "2024-01-01T00:00:00Z", "v": 42.5}, {"t": "2024-01-01T00:05:00Z", "v": 40}],'
+            b'"snr.db": [{"t": "2024-01-01T00:00:00Z", "v": 9.5}]}}'
+        )
+        client = StarlinkClient(environment="local", api_secret="secret")
+        
+        with patch.object(client.terminals, "_req", return_value=response):
+            points = list(client.terminals.iter_metrics("T1", from_time=now_utc(), to_time=now_utc()))
+        
+        assert [(name, point.v) for name, point in points] == [
+            ("latency_ms", 42.5), ("latency_ms", 40.0), ("snr.db", 9.5)
+        ]
+        assert isinstance(points[0][1], MetricPoint)
+        response.close.assert_called_once()
+
+
 # Mock tests would require the actual dependencies to be installed
 # These are placeholder tests to show the structure
 